@@ -1,33 +1,41 @@
 import numpy as np
+from scipy import fft as sp_fft
 from scipy.signal import get_window
 
 
 class Analyzer:
     def __init__(self, sample_rate=48000, fft_size=2048):
         self.sample_rate = sample_rate
-        self.fft_size = fft_size
+        # Pad up to a size the FFT backend handles without a slow path
+        self.fft_size = int(sp_fft.next_fast_len(int(fft_size), real=True))
         self.window = get_window('hann', self.fft_size, fftbins=True).astype(np.float32)
         self.prev_mag = np.zeros(self.fft_size // 2 + 1, dtype=np.float32)
         self.flux_smooth = 0.0
         self.flux_alpha = 0.9
         self.hop = self.fft_size // 2
         self.buffer = np.zeros(self.fft_size, dtype=np.float32)
+        # Per-frame scratch, reused so compute() allocates only the FFT output
+        self._windowed = np.empty(self.fft_size, dtype=np.float32)
+        self._mag = np.empty(self.fft_size // 2 + 1, dtype=np.float32)
+        self._diff = np.empty(self.fft_size // 2 + 1, dtype=np.float32)
 
     def compute(self, x):
-        n = len(x)
-        if n >= self.hop:
-            self.buffer[:-self.hop] = self.buffer[self.hop:]
-            self.buffer[-self.hop:] = x[-self.hop:]
-        else:
-            self.buffer = np.roll(self.buffer, -n)
-            self.buffer[-n:] = x
+        n = min(len(x), self.fft_size)
+        step = min(n, self.hop)
+        buf = self.buffer
+        if step > 0:
+            buf[:-step] = buf[step:]
+            buf[-step:] = x[-step:]
 
-        windowed = self.buffer * self.window
-        mag = np.abs(np.fft.rfft(windowed, n=self.fft_size)).astype(np.float32)
+        np.multiply(buf, self.window, out=self._windowed)
+        # float32 in -> complex64 out; no float64 round trip
+        spec = sp_fft.rfft(self._windowed, overwrite_x=True)
+        mag = np.abs(spec, out=self._mag)
 
-        diff = np.maximum(0.0, mag - self.prev_mag)
-        flux = float(np.sum(diff)) / len(mag)
+        diff = np.subtract(mag, self.prev_mag, out=self._diff)
+        np.maximum(diff, 0.0, out=diff)
+        flux = float(diff.sum()) / len(mag)
         self.flux_smooth = self.flux_alpha * self.flux_smooth + (1 - self.flux_alpha) * flux
 
-        self.prev_mag = mag
+        self.prev_mag[:] = mag
         return np.log1p(mag), self.flux_smooth
@@ -1,7 +1,6 @@
 import logging
 import os
 import platform
-import tempfile
 import threading
 
 import numpy as np
@@ -47,11 +46,16 @@ class AudioEngine:
 
         self.analyzer = Analyzer(sample_rate=self.sample_rate, fft_size=2048)
         self.out_stream = None
+        # Serialises stream close/reopen; device switches run off the GUI thread
+        self._stream_lock = threading.RLock()
+        self._closed = False
 
+        # Single-producer/single-consumer ring: the audio callback writes
+        # samples, then publishes _rb_write with one attribute store; the GUI
+        # reads _rb_write once and copies behind it. No lock on either side.
         self._rb_size = max(self.block_size * 16, 8192)
         self._ring = np.zeros(self._rb_size, dtype=np.float32)
         self._rb_write = 0
-        self._lock = threading.Lock()
         self._stream_sr = int(sample_rate)
 
         self._open_output_stream(self.sample_rate)
@@ -76,10 +80,46 @@ class AudioEngine:
         return out
 
     def set_output_device_by_index(self, index: int):
-        self._device_out = int(index)
-        self.out_channels = self._pick_output_channels(self._device_out)
-        target_sr = int(self._sf_sr) if self._sf is not None and self._sf_sr else self.sample_rate
-        self._open_output_stream(target_sr or 48000)
+        with self._stream_lock:
+            target_sr = int(self._sf_sr) if self._sf is not None and self._sf_sr else self.sample_rate
+            self._switch_device(int(index), target_sr or 48000)
+
+    def configure(self, cfg):
+        """Apply an AudioConfig (device_id, sample_rate) with at most one
+        stream reopen. No-op when the open stream already matches.
+
+        ``sample_rate`` is a hint: a loaded file's rate wins, and the device
+        may force its default. ``self.sample_rate`` always reports the rate
+        of the stream that is actually open."""
+        with self._stream_lock:
+            dev = getattr(cfg, "device_id", None)
+            dev = self._device_out if dev is None else int(dev)
+            if self._sf is not None and self._sf_sr:
+                # A loaded file dictates the stream rate
+                sr = int(self._sf_sr)
+            else:
+                sr = int(getattr(cfg, "sample_rate", None) or self.sample_rate)
+            if self.out_stream is not None and dev == self._device_out and sr == self._stream_sr:
+                return
+            self._switch_device(dev, sr)
+
+    def _switch_device(self, dev, sr):
+        # Caller holds _stream_lock. On failure the previous device and rate
+        # are reopened, so output_device_index keeps describing the stream
+        # that is actually open, and the error is re-raised.
+        prev, prev_sr = self._device_out, self._stream_sr
+        self._device_out = dev
+        self.out_channels = self._pick_output_channels(dev)
+        try:
+            self._open_output_stream(sr)
+        except Exception:
+            self._device_out = prev
+            self.out_channels = self._pick_output_channels(prev)
+            try:
+                self._open_output_stream(prev_sr or sr)
+            except Exception:
+                pass
+            raise
 
     def _pick_output_channels(self, device_index: int | None) -> int:
         try:
@@ -143,17 +183,20 @@ class AudioEngine:
 
         try:
             mono_vis = stereo.mean(axis=1).astype(np.float32, copy=False)
-            with self._lock:
-                idx = self._rb_write % self._rb_size
-                n = min(frames, self._rb_size)
-                end = idx + n
-                if end <= self._rb_size:
-                    self._ring[idx:end] = mono_vis[:n]
-                else:
-                    first = self._rb_size - idx
-                    self._ring[idx:] = mono_vis[:first]
-                    self._ring[:n - first] = mono_vis[first:n]
-                self._rb_write = (self._rb_write + n) % (1 << 30)
+            # Local refs keep ring and size consistent if the ring is swapped
+            ring = self._ring
+            size = ring.shape[0]
+            w = self._rb_write
+            idx = w % size
+            n = min(frames, size)
+            end = idx + n
+            if end <= size:
+                ring[idx:end] = mono_vis[:n]
+            else:
+                first = size - idx
+                ring[idx:] = mono_vis[:first]
+                ring[:n - first] = mono_vis[first:n]
+            self._rb_write = (w + n) % (1 << 30)
         except Exception:
             pass
 
@@ -162,6 +205,12 @@ class AudioEngine:
             outdata[:, ch:] = 0.0
 
     def _open_output_stream(self, sr):
+        with self._stream_lock:
+            # A switch still queued on the pool must not reopen after close()
+            if not self._closed:
+                self._reopen_stream(sr)
+
+    def _reopen_stream(self, sr):
         try:
             if self.out_stream is not None:
                 self.out_stream.abort(ignore_errors=True)
@@ -202,52 +251,56 @@ class AudioEngine:
     # -- Transport --
 
     def load_file(self, path: str):
-        if self._sf is not None:
-            try:
-                self._sf.close()
-            except Exception:
-                pass
-        if self._tmp_wav_path:
-            try:
-                os.unlink(self._tmp_wav_path)
-            except Exception:
-                pass
-            self._tmp_wav_path = None
+        with self._stream_lock:
+            if self._sf is not None:
+                try:
+                    self._sf.close()
+                except Exception:
+                    pass
+            if self._tmp_wav_path:
+                try:
+                    os.unlink(self._tmp_wav_path)
+                except Exception:
+                    pass
+                self._tmp_wav_path = None
 
-        self.current_audio_path = path
+            self.current_audio_path = path
 
-        try:
-            self._sf = sf.SoundFile(path, mode="r")
-        except Exception:
             try:
-                import audioread
-            except ImportError as e:
-                raise RuntimeError("MP3 support requires 'audioread' (pip install audioread)") from e
-
-            with audioread.audio_open(path) as ar:
-                _sr = int(ar.samplerate)
-                _ch = int(ar.channels)
-                _pcm = b"".join(b for b in ar)
-
-            x = np.frombuffer(_pcm, dtype="<i2").astype(np.float32) / 32768.0
-            x = x.reshape(-1, _ch) if _ch > 1 else x.reshape(-1, 1)
-
-            tmp = tempfile.NamedTemporaryFile(prefix="aurora_", suffix=".wav", delete=False)
-            tmp_path = tmp.name
-            tmp.close()
-            sf.write(tmp_path, x, _sr, subtype="PCM_16")
-            self._tmp_wav_path = tmp_path
-            self._sf = sf.SoundFile(tmp_path, mode="r")
-
-        self._sf_sr = int(self._sf.samplerate)
-        self._eof = False
-        self._playing = False
-        self._sf.seek(0)
-        self._open_output_stream(self._sf_sr)
+                self._sf = sf.SoundFile(path, mode="r")
+            except Exception:
+                # Fallback-only modules; most formats open directly via soundfile
+                import tempfile
+                try:
+                    import audioread
+                except ImportError as e:
+                    raise RuntimeError("MP3 support requires 'audioread' (pip install audioread)") from e
+
+                with audioread.audio_open(path) as ar:
+                    _sr = int(ar.samplerate)
+                    _ch = int(ar.channels)
+                    _pcm = b"".join(b for b in ar)
+
+                x = np.frombuffer(_pcm, dtype="<i2").astype(np.float32) / 32768.0
+                x = x.reshape(-1, _ch) if _ch > 1 else x.reshape(-1, 1)
+
+                tmp = tempfile.NamedTemporaryFile(prefix="aurora_", suffix=".wav", delete=False)
+                tmp_path = tmp.name
+                tmp.close()
+                sf.write(tmp_path, x, _sr, subtype="PCM_16")
+                self._tmp_wav_path = tmp_path
+                self._sf = sf.SoundFile(tmp_path, mode="r")
+
+            self._sf_sr = int(self._sf.samplerate)
+            self._eof = False
+            self._playing = False
+            self._sf.seek(0)
+            self._open_output_stream(self._sf_sr)
+            self._reset_ring()
 
-        with self._lock:
-            self._ring.fill(0.0)
-            self._rb_write = 0
+    @property
+    def is_playing(self):
+        return self._playing
 
     def play(self):
         if self._sf is not None:
@@ -265,23 +318,34 @@ class AudioEngine:
         frame = max(0, min(int(seconds * self._sf_sr), len(self._sf)))
         self._sf.seek(frame)
         self._eof = False
-        with self._lock:
-            self._ring.fill(0.0)
-            self._rb_write = 0
+        self._reset_ring()
 
     seek = seek_seconds
 
+    def _reset_ring(self, size=None):
+        # A fresh array rather than fill(): the callback may still hold the
+        # old one and its stray writes must not land in the new ring. The
+        # ring is published before the index is reset; a callback that read
+        # the old index can still store w+n afterwards, which only offsets
+        # the next read window within the freshly zeroed ring for one block.
+        size = int(size or self._rb_size)
+        ring = np.zeros(size, dtype=np.float32)
+        self._ring = ring
+        self._rb_size = size
+        self._rb_write = 0
+
     # -- Visuals frame --
 
     def get_frame(self):
-        with self._lock:
-            n = self.block_size
-            end = self._rb_write % self._rb_size
-            start = (end - n) % self._rb_size
-            if start < end:
-                samples = self._ring[start:end].copy()
-            else:
-                samples = np.concatenate((self._ring[start:], self._ring[:end])).copy()
+        ring = self._ring
+        size = ring.shape[0]
+        n = self.block_size
+        end = self._rb_write % size
+        start = (end - n) % size
+        if start < end:
+            samples = ring[start:end].copy()
+        else:
+            samples = np.concatenate((ring[start:], ring[:end]))
 
         if samples.shape[0] != self.block_size:
             tmp = np.zeros(self.block_size, dtype=np.float32)
@@ -331,10 +395,7 @@ class AudioEngine:
             self.block_size = int(frames)
         except Exception:
             return
-        with self._lock:
-            self._rb_size = max(self.block_size * 16, 8192)
-            self._ring = np.zeros(self._rb_size, dtype=np.float32)
-            self._rb_write = 0
+        self._reset_ring(max(self.block_size * 16, 8192))
         sr = self.out_stream.samplerate if self.out_stream is not None else self.sample_rate
         self._open_output_stream(sr)
 
@@ -351,12 +412,15 @@ class AudioEngine:
     # -- Lifecycle --
 
     def close(self):
-        try:
-            if self.out_stream is not None:
-                self.out_stream.abort(ignore_errors=True)
-                self.out_stream.close()
-        except Exception:
-            pass
+        with self._stream_lock:
+            self._closed = True
+            try:
+                if self.out_stream is not None:
+                    self.out_stream.abort(ignore_errors=True)
+                    self.out_stream.close()
+            except Exception:
+                pass
+            self.out_stream = None
         try:
             if self._sf is not None:
                 self._sf.close()
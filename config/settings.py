@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import copy
 import dataclasses
 import json
 import os
 from dataclasses import dataclass
 from typing import Any, Dict, Literal, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 CONFIG_DIR = os.path.join(os.path.expanduser("~"), ".config", "AudioVis")
 PRESET_DIR = os.path.join(CONFIG_DIR, "presets")
 os.makedirs(PRESET_DIR, exist_ok=True)
@@ -13,6 +19,24 @@ os.makedirs(PRESET_DIR, exist_ok=True)
 AUDIO_STATE_FILE = os.path.join(CONFIG_DIR, "audio.json")
 
 
+def _read_json(path: str):
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_json(path: str, data) -> None:
+    # Same indent-2 layout either way, so files stay interchangeable
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
 def load_audio_state() -> Dict[str, Any]:
     defaults = {
         "output_device_index": None,
@@ -21,8 +45,7 @@ def load_audio_state() -> Dict[str, Any]:
         "sample_rate": 48000,
     }
     try:
-        with open(AUDIO_STATE_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_json(AUDIO_STATE_FILE)
         if not isinstance(data, dict):
             return dict(defaults)
 
@@ -54,8 +77,7 @@ def save_audio_state(state: Dict[str, Any] | int | None, sample_rate: int | None
                 "sample_rate": int(sample_rate or 48000),
             }
         os.makedirs(CONFIG_DIR, exist_ok=True)
-        with open(AUDIO_STATE_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        _write_json(AUDIO_STATE_FILE, data)
     except Exception:
         pass
 
@@ -86,7 +108,7 @@ class HotkeyConfig:
     toggle_safe_mode: str = "Ctrl+M"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BackgroundConfig:
     path: Optional[str] = None
     scale_mode: Literal["fill", "fit", "stretch", "center", "tile"] = "fill"
@@ -95,7 +117,7 @@ class BackgroundConfig:
     dim_percent: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ShadowConfig:
     enabled: bool = False
     opacity_percent: int = 50
@@ -105,7 +127,7 @@ class ShadowConfig:
     spread: int = 6
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RadialFillConfig:
     enabled: bool = False
     color: str = "#80FFFFFF"
@@ -113,7 +135,9 @@ class RadialFillConfig:
     threshold: float = 0.1
 
 
-@dataclass
+# Not frozen: params and the audio/export/hotkey configs are mutable, so
+# freezing the outer shell would promise immutability it cannot give
+@dataclass(slots=True)
 class AppState:
     version: int = 1
     theme: str = "Neon Grid"
@@ -149,31 +173,59 @@ def migrate_state(d: dict) -> dict:
     return d
 
 
+def _copy_state(st: AppState) -> AppState:
+    # Cached presets are handed out as copies: params and the audio, export
+    # and hotkey configs are mutable; the frozen leaf configs can be shared
+    return dataclasses.replace(
+        st,
+        audio=dataclasses.replace(st.audio),
+        params=copy.deepcopy(st.params),
+        export=dataclasses.replace(st.export),
+        hotkeys=dataclasses.replace(st.hotkeys),
+    )
+
+
 class PresetStore:
     def __init__(self, dir_path: str = PRESET_DIR):
         self.dir = dir_path
         os.makedirs(self.dir, exist_ok=True)
+        # name -> (mtime_ns, parsed preset); names keyed by dir mtime_ns
+        self._cache: Dict[str, tuple] = {}
+        self._names: Optional[tuple] = None
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.dir, f"{name}.json")
 
     def list_presets(self):
+        try:
+            mtime = os.stat(self.dir).st_mtime_ns
+        except OSError:
+            mtime = None
+        if self._names is not None and mtime is not None and self._names[0] == mtime:
+            return list(self._names[1])
         out = []
         for name in os.listdir(self.dir):
             if name.endswith(".json"):
                 out.append(name[:-5])
-        return sorted(out)
+        out.sort()
+        self._names = (mtime, tuple(out))
+        return out
 
     list_names = list_presets
 
     def save(self, name: str, state: AppState):
-        path = os.path.join(self.dir, f"{name}.json")
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(dataclass_to_dict(state), f, indent=2)
+        path = self._path(name)
+        _write_json(path, dataclass_to_dict(state))
+        self._names = None
 
     def load(self, name: str) -> AppState:
-        path = os.path.join(self.dir, f"{name}.json")
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        data = migrate_state(data)
-        return AppState(
+        path = self._path(name)
+        mtime = os.stat(path).st_mtime_ns
+        hit = self._cache.get(name)
+        if hit is not None and hit[0] == mtime:
+            return _copy_state(hit[1])
+        data = migrate_state(_read_json(path))
+        st = AppState(
             version=data.get("version", 1),
             theme=data.get("theme", DEFAULT_STATE.theme),
             audio=dict_to_dataclass(AudioConfig, data.get("audio", {})),
@@ -185,10 +237,14 @@ class PresetStore:
             shadow=dict_to_dataclass(ShadowConfig, data.get("shadow", {})),
             radial_fill=dict_to_dataclass(RadialFillConfig, data.get("radial_fill", {})),
         )
+        self._cache[name] = (mtime, st)
+        return _copy_state(st)
 
     def delete(self, name: str):
-        path = os.path.join(self.dir, f"{name}.json")
+        path = self._path(name)
         try:
             os.unlink(path)
         except FileNotFoundError:
             pass
+        self._cache.pop(name, None)
+        self._names = None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import platform
@@ -10,7 +11,7 @@ from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import soundfile as sf
-from PySide6.QtGui import QColor
+from PySide6.QtGui import QColor, QImage, QPainter
 
 from audio.analysis import Analyzer
 from config.settings import BackgroundConfig
@@ -22,12 +23,13 @@ logger = logging.getLogger(__name__)
 def _color_hex(col, fallback="#FFFFFFFF") -> str:
     if isinstance(col, str):
         return col
-    if hasattr(col, 'name'):
-        try:
-            return col.name(QColor.HexArgb)
-        except Exception:
-            return col.name()
-    return fallback
+    name = getattr(col, 'name', None)
+    if name is None:
+        return fallback
+    try:
+        return name(QColor.HexArgb)
+    except Exception:
+        return name()
 
 
 class _Feeder:
@@ -47,9 +49,10 @@ class _FFmpegDecodedAudio:
     """Decode non-WAV audio to raw float32 via ffmpeg subprocess."""
 
     def __init__(self, path, target_sr=None):
-        ffmpeg = shutil.which('ffmpeg')
-        if ffmpeg is None:
-            raise RuntimeError('ffmpeg not found for decoding non-WAV formats.')
+        try:
+            ffmpeg = _ffmpeg_bin()
+        except RuntimeError as e:
+            raise RuntimeError('ffmpeg not found for decoding non-WAV formats.') from e
         self.samplerate = int(target_sr or 48000)
         cmd = [
             ffmpeg, '-v', 'error', '-i', path,
@@ -111,6 +114,7 @@ class QPainterOffscreenRenderer:
         except Exception:
             self._sf = _FFmpegDecodedAudio(self.audio_path)
         self.duration = float(len(self._sf) / self._sf.samplerate)
+        self._hop = max(1, int(self._sf.samplerate / self.fps))
         self._an = Analyzer(sample_rate=int(self._sf.samplerate), fft_size=2048)
 
         self._feeder = _Feeder()
@@ -225,11 +229,12 @@ class QPainterOffscreenRenderer:
             pass
 
     def _read_frame(self, t):
-        sr = self._sf.samplerate
-        hop = max(1, int(sr / self.fps))
-        pos = int(max(0, min(len(self._sf) - 1, t * sr)))
+        return self._read_at(int(t * self._sf.samplerate))
+
+    def _read_at(self, pos):
+        pos = max(0, min(len(self._sf) - 1, pos))
         self._sf.seek(pos)
-        y = self._sf.read(hop, dtype='float32', always_2d=False)
+        y = self._sf.read(self._hop, dtype='float32', always_2d=False)
         if y.ndim > 1:
             y = y.mean(axis=1)
         samples = np.zeros(1024, dtype=np.float32)
@@ -243,14 +248,21 @@ class QPainterOffscreenRenderer:
         self._feeder._flux = float(flux)
         return samples, spec
 
-    def render_frame(self, t):
-        samples, spectrum = self._read_frame(t)
+    def _paint(self, samples, spectrum):
         img = self._view.render_frame_to_qimage(self.width, self.height, samples, spectrum)
         return _qimage_to_numpy(img)
 
+    def render_frame(self, t):
+        return self._paint(*self._read_frame(t))
+
     def render_time(self, t):
         return self.render_frame(t)
 
+    def render_index(self, i):
+        """Render video frame ``i``; the audio offset stays an exact integer
+        so long exports don't drift against the encoded timeline."""
+        return self._paint(*self._read_at(i * int(self._sf.samplerate) // self.fps))
+
 
 class QPainterOpenGLOffscreenRenderer(QPainterOffscreenRenderer):
     """GPU-backed QPainter via offscreen OpenGL FBO. Falls back to CPU if
@@ -286,11 +298,7 @@ class QPainterOpenGLOffscreenRenderer(QPainterOffscreenRenderer):
         self._fbo = QOpenGLFramebufferObject(self.width, self.height)
         self._pdev = QOpenGLPaintDevice(QSize(self.width, self.height))
 
-    def render_frame(self, t):
-        from PySide6.QtGui import QPainter, QImage
-
-        samples, spectrum = self._read_frame(t)
-
+    def _paint(self, samples, spectrum):
         self._ctx.makeCurrent(self._surface)
         self._fbo.bind()
         try:
@@ -316,6 +324,7 @@ class QPainterOpenGLOffscreenRenderer(QPainterOffscreenRenderer):
 
 # -- ffmpeg utilities --
 
+@functools.lru_cache(maxsize=None)
 def _ffmpeg_bin() -> str:
     """Resolve ffmpeg: AURORA_FFMPEG env, IMAGEIO_FFMPEG_EXE env,
     imageio_ffmpeg package, then system PATH."""
@@ -341,14 +350,15 @@ def _ffmpeg_bin() -> str:
     return bin_path
 
 
-def _ffmpeg_encoders(ffmpeg: str) -> set[str]:
+@functools.lru_cache(maxsize=None)
+def _ffmpeg_encoders(ffmpeg: str) -> frozenset[str]:
     try:
         out = subprocess.check_output(
             [ffmpeg, "-hide_banner", "-encoders"],
             stderr=subprocess.STDOUT, text=True, errors="ignore",
         )
     except Exception:
-        return set()
+        return frozenset()
 
     enc: set[str] = set()
     for line in out.splitlines():
@@ -357,7 +367,19 @@ def _ffmpeg_encoders(ffmpeg: str) -> set[str]:
         parts = line.split()
         if len(parts) >= 2:
             enc.add(parts[1].strip())
-    return enc
+    return frozenset(enc)
+
+
+@functools.lru_cache(maxsize=None)
+def _nvidia_gpus() -> Tuple[str, ...]:
+    smi = shutil.which("nvidia-smi")
+    if not smi:
+        return ()
+    try:
+        out = subprocess.check_output([smi, "-L"], text=True, errors="ignore")
+    except Exception:
+        return ()
+    return tuple(l.strip() for l in out.splitlines() if l.strip().startswith("GPU "))
 
 
 def _ensure_ext(path: str, default_ext: str) -> str:
@@ -378,14 +400,7 @@ def list_gpu_export_devices() -> List[Dict[str, str]]:
         return opts
 
     if "h264_nvenc" in enc or "hevc_nvenc" in enc:
-        gpus: List[str] = []
-        smi = shutil.which("nvidia-smi")
-        if smi:
-            try:
-                out = subprocess.check_output([smi, "-L"], text=True, errors="ignore")
-                gpus = [l.strip() for l in out.splitlines() if l.strip().startswith("GPU ")]
-            except Exception:
-                pass
+        gpus = _nvidia_gpus()
         if gpus:
             for i, line in enumerate(gpus):
                 opts.append({"id": f"nvenc:{i}", "label": f"NVIDIA NVENC ({line})"})
@@ -533,18 +548,25 @@ class Exporter:
             cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
             stderr=subprocess.PIPE, bufsize=10 ** 7,
         )
-        total_frames = int(np.ceil(renderer.duration * self.fps)) if hasattr(renderer, 'duration') else 0
+        duration = getattr(renderer, 'duration', None)
+        total_frames = int(np.ceil(duration * self.fps)) if duration is not None else 0
+
+        # Renderer and pipe are fixed for the whole export; resolve them once
+        render = renderer.render_index
+        write = proc.stdin.write
+        progress_every = max(1, self.fps // 2)
+        pct_scale = 100.0 / max(total_frames, 1)
 
         for i in range(total_frames):
-            t = i / self.fps
-            frame = np.ascontiguousarray(renderer.render_time(t))
+            frame = np.ascontiguousarray(render(i))
             try:
-                proc.stdin.write(frame.tobytes())
+                # Hand the array buffer straight to the pipe; tobytes() would copy every frame
+                write(frame.data)
             except BrokenPipeError:
                 break
-            if progress_cb and (i % max(1, int(self.fps / 2)) == 0):
+            if progress_cb and (i % progress_every == 0):
                 try:
-                    progress_cb(int(i * 100 / total_frames) if total_frames else 0)
+                    progress_cb(int(i * pct_scale))
                 except Exception:
                     pass
 
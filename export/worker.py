@@ -68,8 +68,15 @@ def main(argv: list[str]) -> int:
             gpu_device=cfg.get("gpu_device") or "",
         )
 
+        last_pct = [-1]
+
         def on_progress(pct: int) -> None:
-            _emit({"type": "progress", "pct": int(pct)})
+            # Each line is parsed on the GUI side; only send actual changes
+            pct = int(pct)
+            if pct == last_pct[0]:
+                return
+            last_pct[0] = pct
+            _emit({"type": "progress", "pct": pct})
 
         exporter.render_to_file(cfg["out_path"], progress_cb=on_progress)
         _emit({"type": "done"})
@@ -7,13 +7,19 @@ fmt = QSurfaceFormat()
 fmt.setDepthBufferSize(0)
 fmt.setStencilBufferSize(8)
 fmt.setSwapBehavior(QSurfaceFormat.DoubleBuffer)
+# Frame pacing comes from the UI timer; don't block swaps on vsync or ask for MSAA
+fmt.setSwapInterval(0)
+fmt.setSamples(0)
 QSurfaceFormat.setDefaultFormat(fmt)
 
-from ui.main_window import MainWindow
-
 
 def main():
     app = QApplication(sys.argv)
+
+    # Deferred so the default surface format and QApplication are set up
+    # before the UI/audio/export import graph is loaded
+    from ui.main_window import MainWindow
+
     win = MainWindow()
     win.resize(1280, 800)
     win.show()
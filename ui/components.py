@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import dataclasses
 import os
+from contextlib import ExitStack
 from typing import Callable, Optional, Tuple
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QSignalBlocker, Qt, QTimer, QUrl, Slot
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QCheckBox,
@@ -28,6 +30,9 @@ from PySide6.QtWidgets import (
 
 from config.settings import AppState, BackgroundConfig, HotkeyConfig, PresetStore
 
+# Percent sliders -> 0..1 floats
+_INV_100 = 1.0 / 100.0
+
 
 def _compact_form(parent: QWidget) -> QFormLayout:
     f = QFormLayout(parent)
@@ -39,11 +44,91 @@ def _compact_form(parent: QWidget) -> QFormLayout:
     return f
 
 
+def _rgb(col: QColor) -> Tuple[int, int, int]:
+    return (col.red(), col.green(), col.blue())
+
+
+def _debounce_timer(parent: QWidget, slot: Callable[[], None], interval_ms: int = 16) -> QTimer:
+    t = QTimer(parent)
+    t.setSingleShot(True)
+    t.setInterval(interval_ms)
+    t.timeout.connect(slot)
+    return t
+
+
+class _CallCoalescer:
+    """Collects setter calls from slider drags and replays only the latest
+    value per setter when the debounce timer fires."""
+
+    def __init__(self, parent: QWidget, interval_ms: int = 16):
+        self._pending: dict = {}
+        self._timer = _debounce_timer(parent, self.flush, interval_ms)
+
+    def queue(self, fn: Optional[Callable], value) -> None:
+        if fn is None:
+            return
+        self._pending[fn] = value
+        self._timer.start()
+
+    def flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        for fn, value in pending.items():
+            fn(value)
+
+
+class _ColorPicker:
+    """QColorDialog built on first use and reused for every later pick."""
+
+    def __init__(self, parent: QWidget):
+        self._parent = parent
+        self._dlg: Optional[QColorDialog] = None
+
+    def choose(self, initial: QColor) -> Optional[QColor]:
+        if self._dlg is None:
+            self._dlg = QColorDialog(self._parent)
+            self._dlg.setOption(QColorDialog.ShowAlphaChannel)
+        self._dlg.setCurrentColor(initial)
+        if self._dlg.exec() != QDialog.Accepted:
+            return None
+        col = self._dlg.currentColor()
+        return col if col.isValid() else None
+
+
+class LazyPanel(QWidget):
+    """Tab page that builds its real panel the first time it is shown.
+
+    ``factory`` receives this page as the parent and returns the panel.
+    """
+
+    def __init__(self, factory: Callable[[QWidget], QWidget], parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self._factory = factory
+        self._panel: Optional[QWidget] = None
+        lay = QVBoxLayout(self)
+        lay.setContentsMargins(0, 0, 0, 0)
+        lay.setSpacing(0)
+
+    def is_built(self) -> bool:
+        return self._panel is not None
+
+    def panel(self) -> QWidget:
+        if self._panel is None:
+            factory, self._factory = self._factory, None
+            self._panel = factory(self)
+            self.layout().addWidget(self._panel)
+        return self._panel
+
+    def showEvent(self, event) -> None:
+        self.panel()
+        super().showEvent(event)
+
+
 class BackgroundPanel(QWidget):
     def __init__(self, parent: QWidget, on_change: Callable[[BackgroundConfig], None]):
         super().__init__(parent)
         self._on_change = on_change
         self._cfg = BackgroundConfig()
+        self._file_dlg: Optional[QFileDialog] = None
 
         lay = _compact_form(self)
 
@@ -80,53 +165,98 @@ class BackgroundPanel(QWidget):
         self.dim.setValue(0)
         lay.addRow("Dim", self.dim)
 
-        btn.clicked.connect(self._pick)
-        clr.clicked.connect(self._clear)
-
-        self.scale.currentTextChanged.connect(self._emit)
-        self.offset_x.valueChanged.connect(self._emit)
-        self.offset_y.valueChanged.connect(self._emit)
-        self.dim.valueChanged.connect(self._emit)
-
-    def set_config(self, cfg: BackgroundConfig) -> None:
-        self._cfg = cfg
-        name = os.path.basename(cfg.path) if cfg.path else "No image"
-        self.path_lbl.setText(name)
-        self.path_lbl.setToolTip(cfg.path or "")
-        self.scale.setCurrentText(cfg.scale_mode)
-        self.offset_x.setValue(int(cfg.offset_x))
-        self.offset_y.setValue(int(cfg.offset_y))
-        self.dim.setValue(int(cfg.dim_percent))
-
+        # Coalesce slider drags / spinbox autorepeat to at most one update per frame
+        self._pending_timer = _debounce_timer(self, self._flush_emit)
+
+        btn.clicked.connect(self._pick, Qt.DirectConnection)
+        clr.clicked.connect(self._clear, Qt.DirectConnection)
+
+        # Not QTimer.start directly: its start(int) overload would take the
+        # emitted value as the interval
+        for sig in (
+            self.scale.currentTextChanged,
+            self.offset_x.valueChanged,
+            self.offset_y.valueChanged,
+            self.dim.valueChanged,
+        ):
+            sig.connect(self._schedule_emit, Qt.DirectConnection)
+
+    def set_config(self, cfg: BackgroundConfig, notify: bool = True) -> None:
+        with ExitStack() as stack:
+            for w in (self.scale, self.offset_x, self.offset_y, self.dim):
+                stack.enter_context(QSignalBlocker(w))
+            self._cfg = cfg
+            name = os.path.basename(cfg.path) if cfg.path else "No image"
+            self.path_lbl.setText(name)
+            self.path_lbl.setToolTip(cfg.path or "")
+            self.scale.setCurrentText(cfg.scale_mode)
+            self.offset_x.setValue(int(cfg.offset_x))
+            self.offset_y.setValue(int(cfg.offset_y))
+            self.dim.setValue(int(cfg.dim_percent))
+        # One synchronous notification instead of one per widget
+        if notify:
+            self._flush_emit()
+        else:
+            self._pending_timer.stop()
+
+    def _file_dialog(self) -> QFileDialog:
+        # Built once; keeps its last directory and filter between picks
+        if self._file_dlg is None:
+            dlg = QFileDialog(self, "Choose background image")
+            dlg.setFileMode(QFileDialog.ExistingFile)
+            dlg.setNameFilters(["Images (*.png *.jpg *.jpeg *.webp *.bmp)", "All files (*)"])
+            dlg.setOptions(QFileDialog.Option.DontResolveSymlinks | QFileDialog.Option.ReadOnly)
+            if self._cfg.path:
+                dlg.setDirectory(os.path.dirname(self._cfg.path))
+            dlg.urlSelected.connect(self._on_url_selected)
+            self._file_dlg = dlg
+        return self._file_dlg
+
+    @Slot()
     def _pick(self) -> None:
-        path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Choose background image",
-            "",
-            "Images (*.png *.jpg *.jpeg *.webp *.bmp);;All files (*)",
-        )
+        # open() is still window-modal, but returns at once instead of
+        # spinning a nested event loop like exec() would
+        self._file_dialog().open()
+
+    @Slot(QUrl)
+    def _on_url_selected(self, url: QUrl) -> None:
+        path = url.toLocalFile()
         if not path:
             return
-        self._cfg.path = os.path.abspath(os.path.expanduser(path))
-        self.path_lbl.setText(os.path.basename(self._cfg.path))
-        self.path_lbl.setToolTip(self._cfg.path)
-        self._emit()
+        self._cfg = dataclasses.replace(self._cfg, path=path)
+        self.path_lbl.setText(os.path.basename(path))
+        self.path_lbl.setToolTip(path)
+        self._flush_emit()
 
+    @Slot()
     def _clear(self) -> None:
-        self._cfg.path = None
+        self._cfg = dataclasses.replace(self._cfg, path=None)
         self.path_lbl.setText("No image")
         self.path_lbl.setToolTip("")
-        self._emit()
-
-    def _emit(self) -> None:
-        self._cfg.scale_mode = str(self.scale.currentText() or "fill")
-        self._cfg.offset_x = int(self.offset_x.value())
-        self._cfg.offset_y = int(self.offset_y.value())
-        self._cfg.dim_percent = int(self.dim.value())
+        self._flush_emit()
+
+    @Slot()
+    def _schedule_emit(self) -> None:
+        self._pending_timer.start()
+
+    @Slot()
+    def _flush_emit(self) -> None:
+        self._pending_timer.stop()
+        self._cfg = dataclasses.replace(
+            self._cfg,
+            scale_mode=str(self.scale.currentText() or "fill"),
+            offset_x=int(self.offset_x.value()),
+            offset_y=int(self.offset_y.value()),
+            dim_percent=int(self.dim.value()),
+        )
         self._on_change(self._cfg)
 
 
 class GradientPanel(QWidget):
+    # Startup gradient; the window seeds the view with these before loading state
+    DEFAULT_COLORS = ("#12d6ff", "#ffffff")
+    DEFAULT_CLAMP = (0.05, 0.6)
+
     def __init__(
         self,
         parent: QWidget,
@@ -141,8 +271,13 @@ class GradientPanel(QWidget):
         self._set_clamp = set_clamp
         self._set_smoothing = set_smoothing
 
-        self._a = QColor("#12d6ff")
-        self._b = QColor("#ffffff")
+        self._a = QColor(self.DEFAULT_COLORS[0])
+        self._b = QColor(self.DEFAULT_COLORS[1])
+        self._a_rgb = _rgb(self._a)
+        self._b_rgb = _rgb(self._b)
+        self._picker = _ColorPicker(self)
+        # Held while widgets are built or seeded so nothing reaches the view
+        self._updates_blocked = True
 
         lay = _compact_form(self)
 
@@ -151,8 +286,8 @@ class GradientPanel(QWidget):
         row.setSpacing(6)
         btn_a = QPushButton("Color A")
         btn_b = QPushButton("Color B")
-        btn_a.clicked.connect(lambda: self._pick("a"))
-        btn_b.clicked.connect(lambda: self._pick("b"))
+        btn_a.clicked.connect(self._pick_a, Qt.DirectConnection)
+        btn_b.clicked.connect(self._pick_b, Qt.DirectConnection)
         row.addWidget(btn_a)
         row.addWidget(btn_b)
         btn_wrap = QWidget()
@@ -163,53 +298,79 @@ class GradientPanel(QWidget):
         self.curve.setRange(0.1, 8.0)
         self.curve.setSingleStep(0.1)
         self.curve.setValue(1.0)
-        self.curve.valueChanged.connect(lambda v: self._set_curve(float(v)))
+        self.curve.valueChanged.connect(self._set_curve, Qt.DirectConnection)
         lay.addRow("Curve", self.curve)
 
         self.min_box = QDoubleSpinBox()
         self.min_box.setRange(0.0, 1.0)
         self.min_box.setSingleStep(0.01)
-        self.min_box.setValue(0.05)
+        self.min_box.setValue(self.DEFAULT_CLAMP[0])
         self.max_box = QDoubleSpinBox()
         self.max_box.setRange(0.0, 1.0)
         self.max_box.setSingleStep(0.01)
-        self.max_box.setValue(0.6)
-        self.min_box.valueChanged.connect(self._emit_clamp)
-        self.max_box.valueChanged.connect(self._emit_clamp)
+        self.max_box.setValue(self.DEFAULT_CLAMP[1])
+        self.min_box.valueChanged.connect(self._emit_clamp, Qt.DirectConnection)
+        self.max_box.valueChanged.connect(self._emit_clamp, Qt.DirectConnection)
         lay.addRow("Min", self.min_box)
         lay.addRow("Max", self.max_box)
 
         self.smooth = QSlider(Qt.Horizontal)
         self.smooth.setRange(0, 100)
         self.smooth.setValue(50)
-        self.smooth.valueChanged.connect(lambda v: self._set_smoothing(float(v) / 100.0))
+        self.smooth.valueChanged.connect(self._on_smooth, Qt.DirectConnection)
         lay.addRow("Smooth", self.smooth)
 
-        self._emit_colors()
-        self._emit_clamp()
+        self._updates_blocked = False
+
+    def set_values(self, a: QColor, b: QColor, lo: float, hi: float, smoothing: float) -> None:
+        """Show existing view state without pushing it back to the view."""
+        self._updates_blocked = True
+        try:
+            self._a, self._b = QColor(a), QColor(b)
+            self._a_rgb, self._b_rgb = _rgb(self._a), _rgb(self._b)
+            self.min_box.setValue(float(lo))
+            self.max_box.setValue(float(hi))
+            self.smooth.setValue(int(round(float(smoothing) * 100.0)))
+        finally:
+            self._updates_blocked = False
+
+    @Slot()
+    def _pick_a(self) -> None:
+        self._pick("a")
+
+    @Slot()
+    def _pick_b(self) -> None:
+        self._pick("b")
 
     def _pick(self, which: str) -> None:
-        col = QColorDialog.getColor(
-            self._a if which == "a" else self._b,
-            self,
-            options=QColorDialog.ShowAlphaChannel,
-        )
-        if not col.isValid():
+        col = self._picker.choose(self._a if which == "a" else self._b)
+        if col is None:
             return
         if which == "a":
             self._a = col
+            self._a_rgb = _rgb(col)
         else:
             self._b = col
+            self._b_rgb = _rgb(col)
         self._emit_colors()
 
     def _emit_colors(self) -> None:
-        a = (self._a.red(), self._a.green(), self._a.blue())
-        b = (self._b.red(), self._b.green(), self._b.blue())
-        self._set_colors(a, b)
+        if self._updates_blocked:
+            return
+        self._set_colors(self._a_rgb, self._b_rgb)
 
+    @Slot()
     def _emit_clamp(self) -> None:
+        if self._updates_blocked:
+            return
         self._set_clamp(float(self.min_box.value()), float(self.max_box.value()))
 
+    @Slot(int)
+    def _on_smooth(self, v: int) -> None:
+        if self._updates_blocked:
+            return
+        self._set_smoothing(v * _INV_100)
+
 
 class ShadowPanel(QWidget):
     def __init__(
@@ -229,67 +390,75 @@ class ShadowPanel(QWidget):
         self._set_distance = set_distance
         self._set_angle_deg = set_angle_deg
         self._set_spread = set_spread
+        self._calls = _CallCoalescer(self)
+
+        # Resolve fallbacks once; the direct parent is a tab page, so look
+        # the view up on the top-level window
+        self._blur_fn = set_blur_radius or self._try_parent_view("set_shadow_blur_radius")
+        self._distance_fn = set_distance or self._try_parent_view("set_shadow_distance")
+        self._angle_fn = set_angle_deg or self._try_parent_view("set_shadow_angle_deg")
+        self._spread_fn = set_spread or self._try_parent_view("set_shadow_spread")
 
         lay = _compact_form(self)
 
         self.chk = QCheckBox("Enabled")
-        self.chk.toggled.connect(lambda b: self._set_enabled(bool(b)))
+        self.chk.toggled.connect(self._set_enabled, Qt.DirectConnection)
         lay.addRow(self.chk)
 
         self.opacity = QSlider(Qt.Horizontal)
         self.opacity.setRange(0, 100)
         self.opacity.setValue(50)
-        self.opacity.valueChanged.connect(lambda v: self._set_opacity(int(v)))
+        self.opacity.valueChanged.connect(self._on_opacity, Qt.DirectConnection)
         lay.addRow("Opacity", self.opacity)
 
         self.blur = QSlider(Qt.Horizontal)
         self.blur.setRange(0, 128)
         self.blur.setValue(16)
-        self.blur.valueChanged.connect(self._on_blur)
+        self.blur.valueChanged.connect(self._on_blur, Qt.DirectConnection)
         lay.addRow("Blur", self.blur)
 
         self.distance = QSlider(Qt.Horizontal)
         self.distance.setRange(0, 200)
         self.distance.setValue(8)
-        self.distance.valueChanged.connect(self._on_distance)
+        self.distance.valueChanged.connect(self._on_distance, Qt.DirectConnection)
         lay.addRow("Distance", self.distance)
 
         self.angle = QSlider(Qt.Horizontal)
         self.angle.setRange(0, 360)
         self.angle.setValue(45)
-        self.angle.valueChanged.connect(self._on_angle)
+        self.angle.valueChanged.connect(self._on_angle, Qt.DirectConnection)
         lay.addRow("Angle", self.angle)
 
         self.spread = QSlider(Qt.Horizontal)
         self.spread.setRange(1, 16)
         self.spread.setValue(6)
-        self.spread.valueChanged.connect(self._on_spread)
+        self.spread.valueChanged.connect(self._on_spread, Qt.DirectConnection)
         lay.addRow("Spread", self.spread)
 
     def _try_parent_view(self, method: str):
-        view = getattr(self.parent(), "view", None)
+        view = getattr(self.window(), "view", None)
         fn = getattr(view, method, None)
         return fn if callable(fn) else None
 
+    @Slot(int)
+    def _on_opacity(self, v: int) -> None:
+        self._calls.queue(self._set_opacity, int(v))
+
+    @Slot(int)
     def _on_blur(self, v: int) -> None:
-        fn = self._set_blur_radius or self._try_parent_view("set_shadow_blur_radius")
-        if fn:
-            fn(int(v))
+        self._calls.queue(self._blur_fn, int(v))
 
+    @Slot(int)
     def _on_distance(self, v: int) -> None:
-        fn = self._set_distance or self._try_parent_view("set_shadow_distance")
-        if fn:
-            fn(int(v))
+        self._calls.queue(self._distance_fn, int(v))
 
+    @Slot(int)
     def _on_angle(self, v: int) -> None:
-        fn = self._set_angle_deg or self._try_parent_view("set_shadow_angle_deg")
-        if fn:
-            fn(int(v))
+        self._calls.queue(self._angle_fn, int(v))
 
+    @Slot(int)
     def _on_spread(self, v: int) -> None:
-        fn = self._set_spread or self._try_parent_view("set_shadow_spread")
-        if fn:
-            fn(int(v))
+        self._calls.queue(self._spread_fn, int(v))
 
 
 class RadialFillPanel(QWidget):
@@ -306,37 +475,39 @@ class RadialFillPanel(QWidget):
         self._set_color = set_color
         self._set_blend = set_blend
         self._set_threshold = set_threshold
+        self._picker = _ColorPicker(self)
 
         lay = _compact_form(self)
 
         self.chk = QCheckBox("Enabled")
-        self.chk.toggled.connect(lambda b: self._set_enabled(bool(b)))
+        self.chk.toggled.connect(self._set_enabled, Qt.DirectConnection)
         lay.addRow(self.chk)
 
         btn = QPushButton("Color...")
-        btn.clicked.connect(self._pick_color)
+        btn.clicked.connect(self._pick_color, Qt.DirectConnection)
         lay.addRow(btn)
 
         self.blend = QComboBox()
         self.blend.addItems(["normal", "add", "multiply"])
-        self.blend.currentTextChanged.connect(lambda s: self._set_blend(str(s)))
+        self.blend.currentTextChanged.connect(self._set_blend, Qt.DirectConnection)
         lay.addRow("Blend", self.blend)
 
         self.thr = QSlider(Qt.Horizontal)
         self.thr.setRange(0, 100)
         self.thr.setValue(15)
-        self.thr.valueChanged.connect(lambda v: self._set_threshold(float(v) / 100.0))
+        self.thr.valueChanged.connect(self._on_threshold, Qt.DirectConnection)
         lay.addRow("Threshold", self.thr)
 
+    @Slot()
     def _pick_color(self) -> None:
-        col = QColorDialog.getColor(
-            QColor(255, 255, 255, 64),
-            self,
-            options=QColorDialog.ShowAlphaChannel,
-        )
-        if col.isValid():
+        col = self._picker.choose(QColor(255, 255, 255, 64))
+        if col is not None:
             self._set_color(col.name(QColor.HexArgb))
 
+    @Slot(int)
+    def _on_threshold(self, v: int) -> None:
+        self._set_threshold(v * _INV_100)
+
 
 class GlowPanel(QWidget):
     def __init__(
@@ -352,73 +523,86 @@ class GlowPanel(QWidget):
         self._set_color = set_color
         self._set_radius = set_radius
         self._set_strength = set_strength
+        self._calls = _CallCoalescer(self)
+        self._picker = _ColorPicker(self)
 
         lay = _compact_form(self)
 
         self.chk = QCheckBox("Enabled")
-        self.chk.toggled.connect(lambda b: self._set_enabled(bool(b)))
+        self.chk.toggled.connect(self._set_enabled, Qt.DirectConnection)
         lay.addRow(self.chk)
 
         btn = QPushButton("Color...")
-        btn.clicked.connect(self._pick_color)
+        btn.clicked.connect(self._pick_color, Qt.DirectConnection)
         lay.addRow(btn)
 
         self.radius = QSlider(Qt.Horizontal)
         self.radius.setRange(0, 120)
         self.radius.setValue(22)
-        self.radius.valueChanged.connect(lambda v: self._set_radius(int(v)))
+        self.radius.valueChanged.connect(self._on_radius, Qt.DirectConnection)
         lay.addRow("Radius", self.radius)
 
         self.strength = QSlider(Qt.Horizontal)
         self.strength.setRange(0, 100)
         self.strength.setValue(80)
-        self.strength.valueChanged.connect(lambda v: self._set_strength(int(v)))
+        self.strength.valueChanged.connect(self._on_strength, Qt.DirectConnection)
         lay.addRow("Strength", self.strength)
 
+    @Slot()
     def _pick_color(self) -> None:
-        col = QColorDialog.getColor(
-            QColor(80, 220, 255, 200),
-            self,
-            options=QColorDialog.ShowAlphaChannel,
-        )
-        if col.isValid():
+        col = self._picker.choose(QColor(80, 220, 255, 200))
+        if col is not None:
             self._set_color(col.name(QColor.HexArgb))
 
+    @Slot(int)
+    def _on_radius(self, v: int) -> None:
+        self._calls.queue(self._set_radius, int(v))
+
+    @Slot(int)
+    def _on_strength(self, v: int) -> None:
+        self._calls.queue(self._set_strength, int(v))
+
 
 class HotkeysDialog(QDialog):
+    # (label, editor attribute, HotkeyConfig field)
+    _ROWS = (
+        ("Start/Stop", "ed_start", "start_stop"),
+        ("Next Preset", "ed_next", "next_preset"),
+        ("Prev Preset", "ed_prev", "prev_preset"),
+        ("Screenshot", "ed_shot", "screenshot"),
+        ("Toggle Safe Mode", "ed_safe", "toggle_safe_mode"),
+    )
+
     def __init__(self, parent: QWidget, config: HotkeyConfig):
         super().__init__(parent)
         self.setWindowTitle("Hotkeys")
         self._cfg = config
 
-        lay = QVBoxLayout(self)
-        form = QFormLayout()
-
-        self.ed_start = QKeySequenceEdit(self._cfg.start_stop)
-        self.ed_next = QKeySequenceEdit(self._cfg.next_preset)
-        self.ed_prev = QKeySequenceEdit(self._cfg.prev_preset)
-        self.ed_shot = QKeySequenceEdit(self._cfg.screenshot)
-        self.ed_safe = QKeySequenceEdit(self._cfg.toggle_safe_mode)
-
-        form.addRow("Start/Stop", self.ed_start)
-        form.addRow("Next Preset", self.ed_next)
-        form.addRow("Prev Preset", self.ed_prev)
-        form.addRow("Screenshot", self.ed_shot)
-        form.addRow("Toggle Safe Mode", self.ed_safe)
-
-        lay.addLayout(form)
-        ok = QPushButton("OK")
-        ok.clicked.connect(self.accept)
-        lay.addWidget(ok)
+        # Lay out all rows before the first geometry pass
+        self.setUpdatesEnabled(False)
+        try:
+            lay = QVBoxLayout(self)
+            form = QFormLayout()
+
+            for label, attr, field in self._ROWS:
+                ed = QKeySequenceEdit(getattr(self._cfg, field))
+                # Single chord per action: finish on the first combination, no 1s wait
+                ed.setMaximumSequenceLength(1)
+                ed.editingFinished.connect(self.focusNextChild)
+                setattr(self, attr, ed)
+                form.addRow(label, ed)
+
+            lay.addLayout(form)
+            ok = QPushButton("OK")
+            ok.clicked.connect(self.accept)
+            lay.addWidget(ok)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def get_config(self) -> HotkeyConfig:
-        return HotkeyConfig(
-            start_stop=self.ed_start.keySequence().toString(),
-            next_preset=self.ed_next.keySequence().toString(),
-            prev_preset=self.ed_prev.keySequence().toString(),
-            screenshot=self.ed_shot.keySequence().toString(),
-            toggle_safe_mode=self.ed_safe.keySequence().toString(),
-        )
+        return HotkeyConfig(**{
+            field: getattr(self, attr).keySequence().toString() for _, attr, field in self._ROWS
+        })
 
 
 class PresetsDialog(QDialog):
@@ -436,6 +620,7 @@ class PresetsDialog(QDialog):
         self._mode = mode
         self._state = state
         self.loaded_state: Optional[AppState] = None
+        self.loaded_name: Optional[str] = None
 
         lay = QVBoxLayout(self)
 
@@ -465,9 +650,15 @@ class PresetsDialog(QDialog):
         self._refresh()
 
     def _refresh(self) -> None:
-        self.list.clear()
-        for name in self._store.list_presets():
-            self.list.addItem(name)
+        names = list(self._store.list_presets())
+        lst = self.list
+        # One repaint for the whole refill instead of one per model change
+        lst.setUpdatesEnabled(False)
+        try:
+            lst.clear()
+            lst.addItems(names)
+        finally:
+            lst.setUpdatesEnabled(True)
 
     def _save(self) -> None:
         if self.name is None:
@@ -493,6 +684,7 @@ class PresetsDialog(QDialog):
             QMessageBox.warning(self, "Preset", "Failed to load preset.")
             return
         self.loaded_state = st
+        self.loaded_name = name
         self.accept()
 
     def _delete(self) -> None:
@@ -1,11 +1,18 @@
+import dataclasses
+import functools
 import os
 import sys
 import json
+import operator
 import tempfile
+import time
 from pathlib import Path
 
-from PySide6.QtCore import Qt, QTimer, Signal, QObject, QProcess, QProcessEnvironment
-from PySide6.QtGui import QShortcut, QKeySequence, QColor
+from PySide6.QtCore import (
+    Qt, QTimer, Signal, Slot, QObject, QProcess, QProcessEnvironment, QSignalBlocker,
+    QRunnable, QThreadPool,
+)
+from PySide6.QtGui import QShortcut, QKeySequence, QColor, QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QFileDialog, QComboBox, QPushButton, QSlider,
     QLabel, QHBoxLayout, QVBoxLayout, QSpinBox, QProgressBar, QCheckBox,
@@ -17,11 +24,11 @@ from audio.input import AudioEngine
 from export.exporter import Exporter, list_gpu_export_devices
 from widgets.rt_widget import RTVisualizerWidget
 from ui.components import (
-    BackgroundPanel, GradientPanel, HotkeysDialog, PresetsDialog,
+    BackgroundPanel, GradientPanel, HotkeysDialog, LazyPanel, PresetsDialog,
     RadialFillPanel, ShadowPanel, GlowPanel,
 )
 from config.settings import (
-    PresetStore, DEFAULT_STATE, AppState,
+    PresetStore, DEFAULT_STATE, AppState, AudioConfig,
     BackgroundConfig, ShadowConfig, RadialFillConfig,
     load_audio_state, save_audio_state,
 )
@@ -32,6 +39,142 @@ class _ExportSignals(QObject):
     done = Signal()
     failed = Signal(str)
 
+class _TaskSignals(QObject):
+    # Empty string on success, otherwise the error message
+    done = Signal(str)
+
+def _color_hex(c) -> str:
+    # view.color is an (r, g, b) float tuple; QColor accepted as well
+    if isinstance(c, QColor):
+        return c.name()
+    try:
+        r, g, b = c
+        r = int(max(0, min(255, round(float(r) * 255))))
+        g = int(max(0, min(255, round(float(g) * 255))))
+        b = int(max(0, min(255, round(float(b) * 255))))
+        return QColor(r, g, b).name()
+    except Exception:
+        return ""
+
+def _pct(v) -> int:
+    return int(float(v) * 100.0)
+
+def _str_or_empty(v) -> str:
+    return str(v or "")
+
+def _qcolor_name(c) -> str:
+    return c.name()
+
+# (ini key, view attribute, caster) for state read straight off the view
+_STATE_SPEC = (
+    ("sensitivity", "waveform_sensitivity", float),
+    ("radial_rotation_deg", "radial_rotation_deg", float),
+    ("radial_mirror", "radial_mirror", bool),
+    ("center_motion", "center_motion", int),
+    ("center_image_zoom", "center_image_zoom", int),
+    ("edge_waviness", "edge_waviness", int),
+    ("feather_audio_enabled", "feather_audio_enabled", bool),
+    ("feather_audio_amount", "feather_audio_amount", int),
+    ("center_image_path", "center_image_path", _str_or_empty),
+    ("radial_waveform_smoothness", "radial_wave_smoothness", int),
+    ("radial_temporal_smoothing", "radial_temporal_alpha", _pct),
+
+    ("bg_path", "_bg_path", _str_or_empty),
+    ("bg_scale_mode", "_bg_scale_mode", str),
+    ("bg_dim_percent", "_bg_dim", int),
+
+    ("grad_a", "_grad_a", _qcolor_name),
+    ("grad_b", "_grad_b", _qcolor_name),
+    ("grad_curve", "_grad_curve", str),
+    ("grad_min", "_grad_min", float),
+    ("grad_max", "_grad_max", float),
+    ("grad_smoothing", "_amp_alpha", float),
+
+    ("shadow_enabled", "_shadow_enabled", bool),
+    ("shadow_opacity", "_shadow_opacity", _pct),
+    ("shadow_blur_radius", "_shadow_blur", int),
+    ("shadow_distance", "_shadow_distance", int),
+    ("shadow_angle_deg", "_shadow_angle_deg", int),
+    ("shadow_spread", "_shadow_spread", int),
+
+    ("glow_enabled", "_glow_enabled", bool),
+    ("glow_color", "_glow_color_hex", str),
+    ("glow_radius", "_glow_radius", int),
+    ("glow_strength", "_glow_strength", _pct),
+
+    ("fill_enabled", "_fill_enabled", bool),
+    ("fill_color", "_fill_color_hex", str),
+    ("fill_blend", "_fill_blend", str),
+    ("fill_threshold", "_fill_threshold", float),
+)
+
+@functools.lru_cache(maxsize=64)
+def _key_sequence(text):
+    # Parsed once per distinct hotkey string
+    return QKeySequence(text)
+
+def _fill_combo(combo, rows):
+    # One model swap instead of a relayout per addItem; the old model is
+    # parented to the combo, so setModel() deletes it
+    model = QStandardItemModel(combo)
+    items = []
+    for label, data in rows:
+        it = QStandardItem(label)
+        it.setData(data, Qt.UserRole)
+        items.append(it)
+    model.invisibleRootItem().appendRows(items)
+    combo.setModel(model)
+
+def _save_png(img, path):
+    # Compression level 50 trades a slightly larger file for faster deflate.
+    # Written beside the target and renamed so no partial PNG is left behind.
+    tmp = path + ".tmp"
+    if not img.save(tmp, "PNG", 50):
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise OSError(f"could not write {path}")
+    os.replace(tmp, path)
+
+class _BackgroundTask(QRunnable):
+    """Runs a blocking call on the global thread pool and reports back
+    through a queued signal."""
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = _TaskSignals()
+        self._fn = fn
+        self._args = args
+
+    def run(self):
+        try:
+            self._fn(*self._args)
+        except Exception as e:
+            self.signals.done.emit(str(e) or type(e).__name__)
+        else:
+            self.signals.done.emit("")
+
+_MISSING = object()
+
+# View fields read together when snapshotting state for presets
+_BG_ATTRS = operator.attrgetter("_bg_path", "_bg_scale_mode", "_bg_off", "_bg_dim")
+_SHADOW_ATTRS = operator.attrgetter(
+    "_shadow_enabled", "_shadow_opacity", "_shadow_blur",
+    "_shadow_distance", "_shadow_angle_deg", "_shadow_spread",
+)
+_FILL_ATTRS = operator.attrgetter("_fill_enabled", "_fill_color_hex", "_fill_blend", "_fill_threshold")
+
+# View setters used by _apply_state, bound once per window
+_STATE_SETTERS = operator.attrgetter(
+    "set_background_config",
+    "set_shadow_enabled", "set_shadow_opacity", "set_shadow_blur_radius",
+    "set_shadow_distance", "set_shadow_angle_deg", "set_shadow_spread",
+    "set_radial_fill_enabled", "set_radial_fill_color",
+    "set_radial_fill_blend", "set_radial_fill_threshold",
+)
+
 MODES = [
     "Spectrum - Radial",
     "Spectrum - Linear",
@@ -40,6 +183,7 @@ MODES = [
 ]
 
 class MainWindow(QMainWindow):
+    @Slot(int)
     def _on_mode_changed(self, idx):
         mode = self.mode_combo.currentText()
         try:
@@ -51,34 +195,60 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-    def _on_output_changed(self, idx):
-        try:
-            dev_idx = self.output_combo.itemData(idx)
-            if dev_idx is None:
-                return
-            self.engine.set_output_device_by_index(dev_idx)
-        except Exception:
-            pass
-
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Aurora Visualizer")
 
         self.engine = AudioEngine(sample_rate=48000, block_size=1024)
-        self.view = RTVisualizerWidget(self.engine)
+        # MainWindow's _tick is the single repaint driver for the view
+        self.view = RTVisualizerWidget(self.engine, start_timer=False)
 
         self._preset_store = PresetStore()
+        # Hotkey cycling order; rebuilt when the store's name list changes
+        self._preset_names = None
+        self._preset_index_map = {}
+        self._preset_idx = -1
+        self._pending_cycle = 0
+        self._cycle_timer = QTimer(self)
+        self._cycle_timer.setSingleShot(True)
+        self._cycle_timer.setInterval(80)
+        self._cycle_timer.timeout.connect(self._flush_cycle, Qt.DirectConnection)
         self._app_state = DEFAULT_STATE
         self._hotkeys = DEFAULT_STATE.hotkeys
+        self._device_task = None
+        self._io_tasks = []
+        home = os.path.expanduser("~")
+        desktop = os.path.join(home, "Desktop")
+        self._screenshot_dir = desktop if os.path.isdir(desktop) else home
 
+        self._painted_rev = -1
         self._timer = QTimer(self)
-        self._timer.timeout.connect(self._tick)
-        self._timer.start(16)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(16)
+        self._timer.timeout.connect(self._tick, Qt.DirectConnection)
+        self._timer.start()
 
         self._user_scrubbing = False
-        self._transport_timer = QTimer(self)
-        self._transport_timer.timeout.connect(self._tick_transport)
-        self._transport_timer.start(100)
+        # The scrub bar follows playback every Nth _tick (~100 ms)
+        self._tick_count = 0
+        self._transport_every = 6
+        self._was_playing = False
+        # Track length in seconds; only changes when a file is loaded
+        self._duration = 0.001
+
+        self._view_state_cache = None
+        self._view_state_rev = -1
+        self._snapshot = None
+        self._snapshot_rev = -1
+
+        # Slider-driven view setters are applied at most once per frame
+        self._pending = {}
+
+        self._pending_volume = None
+        self._volume_timer = QTimer(self)
+        self._volume_timer.setSingleShot(True)
+        self._volume_timer.setInterval(20)
+        self._volume_timer.timeout.connect(self._apply_volume, Qt.DirectConnection)
 
         root = QWidget()
         self.setCentralWidget(root)
@@ -169,39 +339,20 @@ class MainWindow(QMainWindow):
         self.export_progress.setVisible(False)
 
         self._build_menu()
+        self._shortcut_map = None
         self._apply_hotkeys()
 
-        self.bg_panel = BackgroundPanel(self, self.view.set_background_config)
-        self.grad_panel = GradientPanel(
-            self,
-            lambda a, b: self._set_grad_colors(a, b),
-            self.view.set_gradient_curve,
-            self.view.set_gradient_clamp,
-            self.view.set_gradient_smoothing,
-        )
-        self.shadow_panel = ShadowPanel(
-            self,
-            self.view.set_shadow_enabled,
-            self.view.set_shadow_opacity,
-            getattr(self.view, 'set_shadow_blur_radius', None),
-            getattr(self.view, 'set_shadow_distance', None),
-            getattr(self.view, 'set_shadow_angle_deg', None),
-            getattr(self.view, 'set_shadow_spread', None),
-        )
-        self.glow_panel = GlowPanel(
-            self,
-            self.view.set_glow_enabled,
-            self.view.set_glow_color,
-            self.view.set_glow_radius,
-            self.view.set_glow_strength,
-        )
-        self.radial_panel = RadialFillPanel(
-            self,
-            self.view.set_radial_fill_enabled,
-            self.view.set_radial_fill_color,
-            self.view.set_radial_fill_blend,
-            self.view.set_radial_fill_threshold,
-        )
+        # The gradient panel used to push its defaults on construction; now
+        # that it is built lazily, seed the view once before state is loaded
+        self.view.set_gradient_colors(*GradientPanel.DEFAULT_COLORS)
+        self.view.set_gradient_clamp(*GradientPanel.DEFAULT_CLAMP)
+
+        # FX panels are built on first show and seeded from the view
+        self.bg_panel = LazyPanel(self._build_bg_panel)
+        self.grad_panel = LazyPanel(self._build_grad_panel)
+        self.shadow_panel = LazyPanel(self._build_shadow_panel)
+        self.glow_panel = LazyPanel(self._build_glow_panel)
+        self.radial_panel = LazyPanel(self._build_radial_panel)
 
         sidebar_inner = QWidget()
         sb = QVBoxLayout(sidebar_inner)
@@ -327,39 +478,43 @@ class MainWindow(QMainWindow):
 
         self._refresh_output_devices()
 
-        self.open_btn.clicked.connect(self._open_audio)
-        self.export_btn.clicked.connect(self._export)
-        self.exp_gpu.toggled.connect(self._on_gpu_export_toggled)
-
-        self.btn_to_start.clicked.connect(self._jump_to_start)
-        self.btn_play.clicked.connect(self._play_only)
-        self.btn_pause.clicked.connect(self._pause_only)
-        self.scrub.sliderPressed.connect(self._begin_scrub)
-        self.scrub.sliderReleased.connect(self._end_scrub)
-
-        self.rot_slider.valueChanged.connect(lambda v: self.view.set_radial_rotation_deg(v))
-        self.mirror_check.toggled.connect(self.view.set_radial_mirror)
-        self.center_motion_slider.valueChanged.connect(self.view.set_center_motion)
-        self.center_zoom_slider.valueChanged.connect(self.view.set_center_image_zoom)
-        self.edge_waviness_slider.valueChanged.connect(self.view.set_edge_waviness)
-        self.feather_audio_check.toggled.connect(self.view.set_feather_audio_enabled)
-        self.feather_audio_slider.valueChanged.connect(self.view.set_feather_audio_amount)
-        self.smooth_amt.valueChanged.connect(self.view.set_radial_smooth_amount)
-        self.radial_smoothness_slider.valueChanged.connect(
-            lambda v: self.view.set_radial_waveform_smoothness(v)
-        )
-        self.radial_temporal_slider.valueChanged.connect(
-            lambda v: self.view.set_radial_temporal_smoothing(v)
-        )
+        self.open_btn.clicked.connect(self._open_audio, Qt.DirectConnection)
+        self.export_btn.clicked.connect(self._export, Qt.DirectConnection)
+        self.exp_gpu.toggled.connect(self._on_gpu_export_toggled, Qt.DirectConnection)
+
+        self.btn_to_start.clicked.connect(self._jump_to_start, Qt.DirectConnection)
+        self.btn_play.clicked.connect(self._play_only, Qt.DirectConnection)
+        self.btn_pause.clicked.connect(self._pause_only, Qt.DirectConnection)
+        self.scrub.sliderPressed.connect(self._begin_scrub, Qt.DirectConnection)
+        self.scrub.sliderReleased.connect(self._end_scrub, Qt.DirectConnection)
+
+        self.mirror_check.toggled.connect(self.view.set_radial_mirror, Qt.DirectConnection)
+        self.feather_audio_check.toggled.connect(self.view.set_feather_audio_enabled, Qt.DirectConnection)
+
+        # widget -> bound view setter, fed through the per-frame coalescer
+        v = self.view
+        self._state_setters = _STATE_SETTERS(v)
+        self._view_sliders = {
+            self.sens_slider: v.set_waveform_sensitivity_pct,
+            self.rot_slider: v.set_radial_rotation_deg,
+            self.center_motion_slider: v.set_center_motion,
+            self.center_zoom_slider: v.set_center_image_zoom,
+            self.edge_waviness_slider: v.set_edge_waviness,
+            self.feather_audio_slider: v.set_feather_audio_amount,
+            self.smooth_amt: v.set_radial_smooth_amount,
+            self.radial_smoothness_slider: v.set_radial_waveform_smoothness,
+            self.radial_temporal_slider: v.set_radial_temporal_smoothing,
+        }
+        for w in self._view_sliders:
+            w.valueChanged.connect(self._on_view_slider, Qt.DirectConnection)
 
-        self.mode_combo.currentIndexChanged.connect(self._on_mode_changed)
-        self.sens_slider.valueChanged.connect(lambda v: self.view.set_waveform_sensitivity(v / 100.0))
-        self.vol_slider.valueChanged.connect(lambda v: self.engine.set_volume(v / 100.0))
-        self.fps_spin.valueChanged.connect(self._set_realtime_fps)
-        self.output_combo.currentIndexChanged.connect(self._on_output_changed)
+        self.mode_combo.currentIndexChanged.connect(self._on_mode_changed, Qt.DirectConnection)
+        self.vol_slider.valueChanged.connect(self._on_volume_change, Qt.DirectConnection)
+        self.fps_spin.valueChanged.connect(self._set_realtime_fps, Qt.DirectConnection)
+        self.output_combo.currentIndexChanged.connect(self._on_output_changed, Qt.DirectConnection)
 
-        self.center_btn.clicked.connect(self._choose_center_image)
-        self.color_btn.clicked.connect(self._choose_color)
+        self.center_btn.clicked.connect(self._choose_center_image, Qt.DirectConnection)
+        self.color_btn.clicked.connect(self._choose_color, Qt.DirectConnection)
 
         self._apply_stylesheet()
 
@@ -367,6 +522,8 @@ class MainWindow(QMainWindow):
         self._load_audio_state()
         self._refresh_gpu_export_options()
         self._load_state_ini()
+        self._screen_hooked = False
+        self._on_screen_changed()
 
     def _build_menu(self):
         mb = self.menuBar()
@@ -380,120 +537,250 @@ class MainWindow(QMainWindow):
         presetm.addAction("Save Preset...").triggered.connect(self._menu_preset_save)
         presetm.addAction("Load Preset...").triggered.connect(self._menu_preset_load)
 
+        viewm = mb.addMenu("&View")
+        self._match_refresh_act = viewm.addAction("Match Refresh Rate")
+        self._match_refresh_act.setCheckable(True)
+        self._match_refresh_act.toggled.connect(self._on_match_refresh_toggled)
+
         hotm = mb.addMenu("&Hotkeys")
         hotm.addAction("Edit Hotkeys...").triggered.connect(self._menu_hotkeys)
 
+    @Slot()
     def _menu_preset_save(self):
         dlg = PresetsDialog(self, self._preset_store, mode="save", state=self._get_state_snapshot())
         dlg.exec()
 
+    @Slot()
     def _menu_preset_load(self):
         dlg = PresetsDialog(self, self._preset_store, mode="load")
         if dlg.exec():
             state = dlg.loaded_state
             if state:
                 self._apply_state(state)
+                # Keep hotkey cycling relative to the preset picked here
+                self._current_preset_name = dlg.loaded_name
+                self._preset_names_cached()
+                self._preset_idx = self._preset_index_map.get(dlg.loaded_name, -1)
 
+    @Slot()
     def _menu_hotkeys(self):
         dlg = HotkeysDialog(self, self._hotkeys)
         if dlg.exec():
             self._hotkeys = dlg.get_config()
             self._apply_hotkeys()
 
+    def _hotkey_specs(self):
+        return (
+            ("start_stop", self._toggle_play_pause),
+            ("next_preset", self._cycle_next),
+            ("prev_preset", self._cycle_prev),
+            ("screenshot", self._screenshot),
+            ("toggle_safe_mode", self._toggle_safe_mode),
+        )
+
     def _apply_hotkeys(self):
-        try:
-            for sc in getattr(self, "_shortcuts", []):
-                sc.setParent(None)
-        except Exception:
-            pass
-        self._shortcuts = []
-        try:
-            sc = QShortcut(QKeySequence(self._hotkeys.start_stop), self)
-            sc.activated.connect(self._toggle_play_pause)
-            self._shortcuts.append(sc)
+        # Shortcuts are created once per spec; later calls only rebind keys
+        if self._shortcut_map is None:
+            self._shortcut_map = {}
+            for field, slot in self._hotkey_specs():
+                sc = QShortcut(self)
+                sc.activated.connect(slot)
+                self._shortcut_map[field] = sc
+            # Holding the play/pause key must not toggle it repeatedly
+            self._shortcut_map["start_stop"].setAutoRepeat(False)
+        for field, sc in self._shortcut_map.items():
+            try:
+                seq = _key_sequence(getattr(self._hotkeys, field))
+                if sc.key() != seq:
+                    sc.setKey(seq)
+            except Exception:
+                pass
+
+    def _preset_names_cached(self):
+        # list_names() is one stat while the preset dir is unchanged, and
+        # still sees presets added or removed outside the app
+        names = self._preset_store.list_names()
+        if names != self._preset_names:
+            self._preset_names = names
+            self._preset_index_map = {n: i for i, n in enumerate(names)}
+            cur = getattr(self, "_current_preset_name", None)
+            self._preset_idx = self._preset_index_map.get(cur, -1)
+        return self._preset_names
 
-            sc = QShortcut(QKeySequence(self._hotkeys.next_preset), self)
-            sc.activated.connect(lambda: self._cycle_preset(+1))
-            self._shortcuts.append(sc)
+    @Slot()
+    def _cycle_next(self):
+        self._queue_cycle(1)
 
-            sc = QShortcut(QKeySequence(self._hotkeys.prev_preset), self)
-            sc.activated.connect(lambda: self._cycle_preset(-1))
-            self._shortcuts.append(sc)
+    @Slot()
+    def _cycle_prev(self):
+        self._queue_cycle(-1)
 
-            sc = QShortcut(QKeySequence(self._hotkeys.screenshot), self)
-            sc.activated.connect(self._screenshot)
-            self._shortcuts.append(sc)
+    def _queue_cycle(self, step):
+        # Held hotkeys repeat at keyboard rate; load only the net target
+        self._pending_cycle += step
+        if not self._cycle_timer.isActive():
+            self._cycle_timer.start()
 
-            sc = QShortcut(QKeySequence(self._hotkeys.toggle_safe_mode), self)
-            sc.activated.connect(self._toggle_safe_mode)
-            self._shortcuts.append(sc)
-        except Exception:
-            pass
+    @Slot()
+    def _flush_cycle(self):
+        step, self._pending_cycle = self._pending_cycle, 0
+        if step:
+            self._cycle_preset(step)
 
     def _cycle_preset(self, step):
         try:
-            names = self._preset_store.list_names()
+            names = self._preset_names_cached()
             if not names:
                 return
-            cur = getattr(self, "_current_preset_name", None)
-            if cur in names:
-                i = names.index(cur)
+            if self._preset_idx < 0:
+                # Nothing cycled yet: next starts at the first, prev at the last
+                i = 0 if step > 0 else len(names) - 1
             else:
-                i = 0
-            i = (i + step) % len(names)
+                i = (self._preset_idx + step) % len(names)
             name = names[i]
             st = self._preset_store.load(name)
             if st:
                 self._apply_state(st)
+                self._preset_idx = i
                 self._current_preset_name = name
         except Exception:
             pass
 
+    @Slot()
     def _screenshot(self):
         try:
-            path, _ = QFileDialog.getSaveFileName(self, "Save screenshot", "", "PNG (*.png)")
+            suggested = os.path.join(self._screenshot_dir, f"aurora_{int(time.time() * 1000)}.png")
+            path, _ = QFileDialog.getSaveFileName(self, "Save screenshot", suggested, "PNG (*.png)")
             if not path:
                 return
             if not os.path.splitext(path)[1]:
                 path = path + ".png"
+            self._screenshot_dir = os.path.dirname(path)
             img = self.view.grabFramebuffer()
-            img.save(path)
         except Exception:
-            pass
+            return
+        # Only the grab needs the GUI thread; PNG encoding runs on the pool
+        task = _BackgroundTask(_save_png, img, path)
+        task.signals.done.connect(self._on_screenshot_saved, Qt.QueuedConnection)
+        self._io_tasks.append(task)
+        QThreadPool.globalInstance().start(task)
+
+    @Slot(str)
+    def _on_screenshot_saved(self, err):
+        sig = self.sender()
+        self._io_tasks = [t for t in self._io_tasks if t.signals is not sig]
+        if err:
+            self.statusBar().showMessage(f"Screenshot failed: {err}")
 
+    @Slot()
     def _toggle_safe_mode(self):
-        try:
-            self.view.set_safe_mode(not getattr(self.view, "safe_mode", False))
-        except Exception:
-            pass
+        self.view.set_safe_mode(not self.view.safe_mode)
 
     def _refresh_output_devices(self):
         try:
             items = self.engine.list_output_devices()
         except Exception:
             items = []
-        self.output_combo.blockSignals(True)
-        self.output_combo.clear()
-        for idx, name in items:
-            self.output_combo.addItem(f"[{idx}] {name}", idx)
-        self.output_combo.blockSignals(False)
-
         try:
             cur = self.engine.output_device_index
         except Exception:
             cur = None
-        if cur is not None:
-            for i in range(self.output_combo.count()):
-                if self.output_combo.itemData(i) == cur:
+
+        # Selecting the device that is already open must not reopen the stream
+        with QSignalBlocker(self.output_combo):
+            _fill_combo(self.output_combo, [(f"[{idx}] {name}", idx) for idx, name in items])
+            if cur is not None:
+                i = self.output_combo.findData(cur)
+                if i >= 0:
                     self.output_combo.setCurrentIndex(i)
-                    break
 
+    @Slot(int)
+    def _on_output_changed(self, idx):
+        dev_idx = self.output_combo.itemData(idx)
+        if dev_idx is None or self._device_task is not None:
+            return
+        # Reopening the output stream blocks; keep it off the GUI thread
+        task = _BackgroundTask(self.engine.set_output_device_by_index, dev_idx)
+        task.signals.done.connect(self._on_output_switched, Qt.QueuedConnection)
+        self._device_task = task
+        self.output_combo.setEnabled(False)
+        QThreadPool.globalInstance().start(task)
+
+    @Slot(str)
+    def _on_output_switched(self, err):
+        self._device_task = None
+        self.output_combo.setEnabled(True)
+        if err:
+            # Point the combo back at the device that is actually open
+            with QSignalBlocker(self.output_combo):
+                i = self.output_combo.findData(self.engine.output_device_index)
+                if i >= 0:
+                    self.output_combo.setCurrentIndex(i)
+            self.statusBar().showMessage(f"Output device change failed: {err}")
+
+    @Slot(int)
+    def _on_view_slider(self, v):
+        self._queue_view(self._view_sliders[self.sender()], v)
+
+    def _queue_view(self, setter, value):
+        self._pending[setter] = value
+
+    def _flush_pending(self):
+        pending, self._pending = self._pending, {}
+        for setter, value in pending.items():
+            try:
+                setter(value)
+            except Exception:
+                pass
+
+    @Slot(int)
+    def _on_volume_change(self, v):
+        # Drags tick once per step; the engine only needs the settled value
+        self._pending_volume = v
+        if not self._volume_timer.isActive():
+            self._volume_timer.start()
+
+    @Slot()
+    def _apply_volume(self):
+        if self._pending_volume is None:
+            return
+        v, self._pending_volume = self._pending_volume, None
+        self.engine.set_volume(v / 100.0)
+
+    @Slot(int)
     def _set_realtime_fps(self, fps):
         try:
-            self.view.set_fps_cap(int(fps))
+            fps = int(fps)
+            self.view.set_fps_cap(fps)
+            interval = max(5, int(round(1000.0 / max(1, fps))))
+            self._timer.setInterval(interval)
+            self._transport_every = max(1, int(round(100.0 / interval)))
         except Exception:
             pass
 
+    def _screen_refresh_rate(self) -> int:
+        try:
+            scr = self.screen()
+            rate = int(round(scr.refreshRate())) if scr is not None else 0
+        except Exception:
+            rate = 0
+        return min(240, rate) if rate > 0 else 60
+
+    @Slot()
+    def _on_screen_changed(self, *_):
+        # Frames above the display refresh are repainted and then dropped
+        rate = self._screen_refresh_rate()
+        self.fps_spin.setMaximum(rate)
+        if self._match_refresh_act.isChecked():
+            self.fps_spin.setValue(rate)
+
+    @Slot(bool)
+    def _on_match_refresh_toggled(self, checked: bool) -> None:
+        self.fps_spin.setEnabled(not checked)
+        if checked:
+            self.fps_spin.setValue(self._screen_refresh_rate())
+
+    @Slot(bool)
     def _on_gpu_export_toggled(self, checked: bool) -> None:
         try:
             self.exp_gpu_device.setEnabled(bool(checked) and self.exp_gpu.isEnabled())
@@ -508,16 +795,11 @@ class MainWindow(QMainWindow):
             opts = []
 
         self._gpu_export_opts = opts
-        try:
-            self.exp_gpu_device.blockSignals(True)
-            self.exp_gpu_device.clear()
-            for o in opts:
-                self.exp_gpu_device.addItem(o.get("label", "GPU"), o.get("id", ""))
-            if not opts:
-                self.exp_gpu_device.addItem("No supported GPU encoders found", "")
-            self.exp_gpu_device.blockSignals(False)
-        except Exception:
-            pass
+        rows = [(o.get("label", "GPU"), o.get("id", "")) for o in opts]
+        if not rows:
+            rows = [("No supported GPU encoders found", "")]
+        with QSignalBlocker(self.exp_gpu_device):
+            _fill_combo(self.exp_gpu_device, rows)
 
         if not opts:
             try:
@@ -533,13 +815,43 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
 
+    @Slot()
     def _tick(self):
-        try:
+        if self._pending:
+            self._flush_pending()
+        playing = self.engine.is_playing
+        if playing or self._was_playing:
+            # Every Nth frame while playing, plus once when playback stops
+            self._tick_count += 1
+            if self._tick_count >= self._transport_every or not playing:
+                self._tick_count = 0
+                self._tick_transport()
+        self._was_playing = playing
+
+        # Paused or idle with no setting changed: the last frame still stands
+        rev = self.view._state_rev
+        if playing or rev != self._painted_rev:
+            self._painted_rev = rev
             self.view.update()
-        except Exception:
-            pass
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._screen_hooked and self.windowHandle() is not None:
+            self.windowHandle().screenChanged.connect(self._on_screen_changed)
+            self._screen_hooked = True
+            self._on_screen_changed()
+        if not self._timer.isActive():
+            self._timer.start()
+        self._tick_transport()
+
+    def hideEvent(self, event):
+        # Hidden or minimized: nothing on screen to repaint or scrub
+        self._flush_pending()
+        self._timer.stop()
+        super().hideEvent(event)
 
     def closeEvent(self, event):
+        self._flush_pending()
         try:
             self._save_audio_state()
         except Exception:
@@ -548,12 +860,15 @@ class MainWindow(QMainWindow):
             self._save_state_ini()
         except Exception:
             pass
+        # Let a pending device switch finish before the engine goes away
+        QThreadPool.globalInstance().waitForDone()
         try:
             self.engine.close()
         except Exception:
             pass
         super().closeEvent(event)
 
+    @Slot()
     def _open_audio(self):
         path, _ = QFileDialog.getOpenFileName(
             self,
@@ -565,6 +880,7 @@ class MainWindow(QMainWindow):
             return
         try:
             self.engine.load_file(path)
+            self._duration = max(0.001, float(self.engine.get_duration_seconds()))
             self.setWindowTitle(f"Aurora Visualizer — {os.path.basename(path)}")
             self.engine.play()
             try:
@@ -575,19 +891,17 @@ class MainWindow(QMainWindow):
         except Exception:
             return
 
+    @Slot()
     def _toggle_play_pause(self):
-        try:
-            if self.engine._playing:
-                self.engine.pause()
-            else:
-                self.engine.play()
-                try:
-                    self.view.reset_time()
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        eng = self.engine
+        if eng.is_playing:
+            eng.pause()
+        else:
+            eng.play()
+            self.view.reset_time()
+        self._tick_transport()
 
+    @Slot()
     def _jump_to_start(self):
         try:
             self.engine.jump_to_start()
@@ -599,47 +913,46 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+    @Slot()
     def _tick_transport(self):
         try:
-            if not self.engine.current_audio_path or self._user_scrubbing:
+            if not self.engine.current_audio_path or self._user_scrubbing or not self.isVisible():
+                return
+            pos = self.engine.get_position_seconds()
+            val = int(max(0.0, min(1000.0, pos * 1000.0 / self._duration)))
+            if val == self.scrub.value():
                 return
-            dur = max(0.001, float(self.engine.get_duration_seconds()))
-            pos = max(0.0, min(dur, float(self.engine.get_position_seconds())))
-            val = int((pos / dur) * 1000)
-            self.scrub.blockSignals(True)
-            self.scrub.setValue(val)
-            self.scrub.blockSignals(False)
+            with QSignalBlocker(self.scrub):
+                self.scrub.setValue(val)
         except Exception:
             pass
 
+    @Slot()
     def _end_scrub(self):
         try:
             val = int(self.scrub.value())
-            dur = max(0.001, float(self.engine.get_duration_seconds()))
-            t = (val / 1000.0) * dur
+            t = (val / 1000.0) * self._duration
             self.engine.seek_seconds(t)
         finally:
             self._user_scrubbing = False
+        self._tick_transport()
 
+    @Slot()
     def _begin_scrub(self):
         self._user_scrubbing = True
 
+    @Slot()
     def _pause_only(self):
-        try:
-            self.engine.pause()
-        except Exception:
-            pass
+        self.engine.pause()
+        self._tick_transport()
 
+    @Slot()
     def _play_only(self):
-        try:
-            self.engine.play()
-            try:
-                self.view.reset_time()
-            except Exception:
-                pass
-        except Exception:
-            pass
+        self.engine.play()
+        self.view.reset_time()
+        self._tick_transport()
 
+    @Slot()
     def _choose_center_image(self):
         path, _ = QFileDialog.getOpenFileName(self, "Choose center image", "", "Images (*.png *.jpg *.jpeg *.bmp)")
         if not path:
@@ -651,12 +964,100 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+    # -- Lazy FX panels --
+
+    @staticmethod
+    def _seed(widget, value):
+        widget.blockSignals(True)
+        try:
+            if isinstance(widget, QCheckBox):
+                widget.setChecked(bool(value))
+            elif isinstance(widget, QComboBox):
+                widget.setCurrentText(str(value))
+            else:
+                widget.setValue(value)
+        finally:
+            widget.blockSignals(False)
+
+    def _build_bg_panel(self, parent):
+        v = self.view
+        panel = BackgroundPanel(parent, v.set_background_config)
+        ox, oy = v._bg_off
+        panel.set_config(BackgroundConfig(
+            path=v._bg_path,
+            scale_mode=v._bg_scale_mode,
+            offset_x=ox,
+            offset_y=oy,
+            dim_percent=v._bg_dim,
+        ), notify=False)
+        return panel
+
+    def _build_grad_panel(self, parent):
+        v = self.view
+        panel = GradientPanel(
+            parent,
+            self._set_grad_colors,
+            v.set_gradient_curve,
+            v.set_gradient_clamp,
+            v.set_gradient_smoothing,
+        )
+        panel.set_values(v._grad_a, v._grad_b, v._grad_min, v._grad_max, v._amp_alpha)
+        return panel
+
+    def _build_shadow_panel(self, parent):
+        v = self.view
+        panel = ShadowPanel(
+            parent,
+            v.set_shadow_enabled,
+            v.set_shadow_opacity,
+            getattr(v, 'set_shadow_blur_radius', None),
+            getattr(v, 'set_shadow_distance', None),
+            getattr(v, 'set_shadow_angle_deg', None),
+            getattr(v, 'set_shadow_spread', None),
+        )
+        self._seed(panel.chk, v._shadow_enabled)
+        self._seed(panel.opacity, int(round(v._shadow_opacity * 100.0)))
+        self._seed(panel.blur, v._shadow_blur)
+        self._seed(panel.distance, v._shadow_distance)
+        self._seed(panel.angle, v._shadow_angle_deg)
+        self._seed(panel.spread, v._shadow_spread)
+        return panel
+
+    def _build_glow_panel(self, parent):
+        v = self.view
+        panel = GlowPanel(
+            parent,
+            v.set_glow_enabled,
+            v.set_glow_color,
+            v.set_glow_radius,
+            v.set_glow_strength,
+        )
+        self._seed(panel.chk, v._glow_enabled)
+        self._seed(panel.radius, v._glow_radius)
+        self._seed(panel.strength, int(round(v._glow_strength * 100.0)))
+        return panel
+
+    def _build_radial_panel(self, parent):
+        v = self.view
+        panel = RadialFillPanel(
+            parent,
+            v.set_radial_fill_enabled,
+            v.set_radial_fill_color,
+            v.set_radial_fill_blend,
+            v.set_radial_fill_threshold,
+        )
+        self._seed(panel.chk, v._fill_enabled)
+        self._seed(panel.thr, int(round(v._fill_threshold * 100.0)))
+        self._seed(panel.blend, v._fill_blend)
+        return panel
+
     def _set_grad_colors(self, a, b):
         try:
             self.view.set_gradient_colors(a, b)
         except Exception:
             pass
 
+    @Slot()
     def _choose_color(self):
         try:
             current = self.view.color
@@ -672,55 +1073,97 @@ class MainWindow(QMainWindow):
             pass
 
     def _get_state_snapshot(self):
-        try:
-            bg = getattr(self.view, "_bg_cfg", BackgroundConfig())
+        # Frozen AppState can be shared until a view setter or the hotkeys change
+        snap = self._snapshot
+        if snap is not None and self._snapshot_rev == self.view._state_rev and snap.hotkeys is self._hotkeys:
+            return snap
+        if snap is not None and self._snapshot_rev == self.view._state_rev:
+            snap = self._snapshot = dataclasses.replace(snap, hotkeys=self._hotkeys)
+            return snap
+        try:
+            bg_path, bg_mode, (off_x, off_y), bg_dim = _BG_ATTRS(self.view)
+            bg = BackgroundConfig(
+                path=bg_path, scale_mode=bg_mode,
+                offset_x=int(off_x), offset_y=int(off_y), dim_percent=int(bg_dim),
+            )
         except Exception:
             bg = BackgroundConfig()
         try:
+            sh_en, sh_op, sh_blur, sh_dist, sh_ang, sh_spread = _SHADOW_ATTRS(self.view)
             sh = ShadowConfig(
-                enabled=bool(self.view._shadow_enabled),
-                opacity_percent=int(float(self.view._shadow_opacity) * 100),
-                blur_radius=int(self.view._shadow_blur),
-                distance=int(self.view._shadow_distance),
-                angle_deg=int(self.view._shadow_angle_deg),
-                spread=int(self.view._shadow_spread),
+                enabled=bool(sh_en),
+                opacity_percent=int(float(sh_op) * 100),
+                blur_radius=int(sh_blur),
+                distance=int(sh_dist),
+                angle_deg=int(sh_ang),
+                spread=int(sh_spread),
             )
         except Exception:
             sh = ShadowConfig()
         try:
+            fl_en, fl_hex, fl_blend, fl_th = _FILL_ATTRS(self.view)
             rf = RadialFillConfig(
-                enabled=bool(self.view._fill_enabled),
-                color=self.view._fill_color.name(QColor.HexArgb),
-                blend=str(self.view._fill_blend),
-                threshold=float(self.view._fill_threshold),
+                enabled=bool(fl_en),
+                color=fl_hex,
+                blend=str(fl_blend),
+                threshold=float(fl_th),
             )
         except Exception:
             rf = RadialFillConfig()
 
-        return AppState(background=bg, shadow=sh, radial_fill=rf, hotkeys=self._hotkeys)
+        self._snapshot = AppState(background=bg, shadow=sh, radial_fill=rf, hotkeys=self._hotkeys)
+        self._snapshot_rev = self.view._state_rev
+        return self._snapshot
 
-    def _apply_state(self, st: AppState):
-        try:
-            self.view.set_background_config(st.background)
-        except Exception:
-            pass
+    def _apply_view(self, setter, attr, value, stored):
+        # Skip setters whose value the view already holds; guard each one
+        # so a bad field does not cancel the rest
         try:
-            self.view.set_shadow_enabled(st.shadow.enabled)
-            self.view.set_shadow_opacity(st.shadow.opacity_percent)
-            self.view.set_shadow_blur_radius(st.shadow.blur_radius)
-            self.view.set_shadow_distance(st.shadow.distance)
-            self.view.set_shadow_angle_deg(st.shadow.angle_deg)
-            self.view.set_shadow_spread(st.shadow.spread)
+            if getattr(self.view, attr, _MISSING) == stored:
+                return
+            setter(value)
         except Exception:
             pass
-        try:
-            self.view.set_radial_fill_enabled(st.radial_fill.enabled)
-            self.view.set_radial_fill_color(st.radial_fill.color)
-            self.view.set_radial_fill_blend(st.radial_fill.blend)
-            self.view.set_radial_fill_threshold(st.radial_fill.threshold)
+
+    def _apply_state(self, st: AppState):
+        v = self.view
+        (set_bg, set_sh_en, set_sh_op, set_sh_blur, set_sh_dist, set_sh_ang, set_sh_spread,
+         set_fl_en, set_fl_color, set_fl_blend, set_fl_th) = self._state_setters
+        bg = st.background
+        try:
+            bg_key = (
+                os.path.abspath(str(bg.path)) if bg.path else None,
+                bg.scale_mode, (int(bg.offset_x), int(bg.offset_y)), int(bg.dim_percent),
+            )
+            if bg_key != (v._bg_path, v._bg_scale_mode, v._bg_off, v._bg_dim):
+                set_bg(bg)
         except Exception:
             pass
 
+        sh = st.shadow
+        sh_new = (
+            bool(sh.enabled), sh.opacity_percent / 100.0, sh.blur_radius,
+            sh.distance, sh.angle_deg, sh.spread,
+        )
+        rf = st.radial_fill
+        rf_new = (bool(rf.enabled), str(rf.color).lower(), rf.blend or "normal", rf.threshold)
+
+        # Whole sections that already match the view are skipped; setter
+        # update() calls coalesce into one paint
+        if _SHADOW_ATTRS(v) != sh_new:
+            self._apply_view(set_sh_en, "_shadow_enabled", sh.enabled, sh_new[0])
+            self._apply_view(set_sh_op, "_shadow_opacity", sh.opacity_percent, sh_new[1])
+            self._apply_view(set_sh_blur, "_shadow_blur", sh.blur_radius, sh_new[2])
+            self._apply_view(set_sh_dist, "_shadow_distance", sh.distance, sh_new[3])
+            self._apply_view(set_sh_ang, "_shadow_angle_deg", sh.angle_deg, sh_new[4])
+            self._apply_view(set_sh_spread, "_shadow_spread", sh.spread, sh_new[5])
+        if _FILL_ATTRS(v) != rf_new:
+            self._apply_view(set_fl_en, "_fill_enabled", rf.enabled, rf_new[0])
+            self._apply_view(set_fl_color, "_fill_color_hex", rf.color, rf_new[1])
+            self._apply_view(set_fl_blend, "_fill_blend", rf.blend, rf_new[2])
+            self._apply_view(set_fl_th, "_fill_threshold", rf.threshold, rf_new[3])
+        self._app_state = st
+
     def _load_audio_state(self):
         st = load_audio_state()
         if not st:
@@ -728,7 +1171,7 @@ class MainWindow(QMainWindow):
         try:
             dev = st.get("output_device_index", None)
             if dev is not None:
-                self.engine.set_output_device_by_index(int(dev))
+                self.engine.configure(AudioConfig(device_id=int(dev), sample_rate=self.engine.sample_rate))
                 self._refresh_output_devices()
                 for i in range(self.output_combo.count()):
                     if self.output_combo.itemData(i) == int(dev):
@@ -753,42 +1196,17 @@ class MainWindow(QMainWindow):
             pass
 
     def _collect_state_ini(self):
-        def _color_hex() -> str:
-            c = self.view.color
-            try:
-                if isinstance(c, QColor):
-                    return c.name()
-            except Exception:
-                pass
-            try:
-                r, g, b = c
-                r = int(max(0, min(255, round(float(r) * 255))))
-                g = int(max(0, min(255, round(float(g) * 255))))
-                b = int(max(0, min(255, round(float(b) * 255))))
-                return QColor(r, g, b).name()
-            except Exception:
-                return ""
-
-        st = {
+        v = self.view
+        st = {key: cast(getattr(v, attr)) for key, attr, cast in _STATE_SPEC}
+        bg_ox, bg_oy = v._bg_off
+        st.update({
             "mode": self.mode_combo.currentText(),
             "realtime_fps": int(self.fps_spin.value()),
-            "sensitivity": float(self.view.waveform_sensitivity),
             "volume": float(self.vol_slider.value() / 100.0),
             "output_device_index": self.engine.output_device_index,
-            "color": _color_hex(),
+            "color": _color_hex(v.color),
             "fx_tab": self.fxTabs.currentIndex(),
-
-            "radial_rotation_deg": float(self.view.radial_rotation_deg),
-            "radial_mirror": bool(self.view.radial_mirror),
             "radial_smooth_amount": int(self.smooth_amt.value() if self.smooth_amt is not None else 50),
-            "center_motion": int(self.view.center_motion),
-            "center_image_zoom": int(self.view.center_image_zoom),
-            "edge_waviness": int(self.view.edge_waviness),
-            "feather_audio_enabled": bool(self.view.feather_audio_enabled),
-            "feather_audio_amount": int(self.view.feather_audio_amount),
-            "center_image_path": str(self.view.center_image_path or ""),
-            "radial_waveform_smoothness": int(self.view.radial_wave_smoothness),
-            "radial_temporal_smoothing": int(float(self.view.radial_temporal_alpha) * 100.0),
 
             "export_width": int(self.exp_w.value()),
             "export_height": int(self.exp_h.value()),
@@ -796,37 +1214,9 @@ class MainWindow(QMainWindow):
             "export_gpu": bool(self.exp_gpu.isChecked()),
             "export_gpu_device": str(self.exp_gpu_device.currentData() or ""),
 
-            "bg_path": str(self.view._bg_path or ""),
-            "bg_scale_mode": str(self.view._bg_scale_mode),
-            "bg_offset_x": int(self.view._bg_off[0]),
-            "bg_offset_y": int(self.view._bg_off[1]),
-            "bg_dim_percent": int(self.view._bg_dim),
-
-            "grad_a": self.view._grad_a.name(),
-            "grad_b": self.view._grad_b.name(),
-            "grad_curve": str(self.view._grad_curve),
-            "grad_min": float(self.view._grad_min),
-            "grad_max": float(self.view._grad_max),
-            "grad_smoothing": float(self.view._amp_alpha),
-
-            "shadow_enabled": bool(self.view._shadow_enabled),
-            "shadow_opacity": int(float(self.view._shadow_opacity) * 100.0),
-            "shadow_blur_radius": int(self.view._shadow_blur),
-            "shadow_distance": int(self.view._shadow_distance),
-            "shadow_angle_deg": int(self.view._shadow_angle_deg),
-            "shadow_spread": int(self.view._shadow_spread),
-
-            "glow_enabled": bool(self.view._glow_enabled),
-            "glow_color": self.view._glow_color.name(QColor.HexArgb),
-            "glow_radius": int(self.view._glow_radius),
-            "glow_strength": int(float(self.view._glow_strength) * 100.0),
-
-            "fill_enabled": bool(self.view._fill_enabled),
-            "fill_color": self.view._fill_color.name(QColor.HexArgb),
-            "fill_blend": str(self.view._fill_blend),
-            "fill_threshold": float(self.view._fill_threshold),
-        }
-
+            "bg_offset_x": int(bg_ox),
+            "bg_offset_y": int(bg_oy),
+        })
         return st
 
     def _save_state_ini(self) -> None:
@@ -882,7 +1272,7 @@ class MainWindow(QMainWindow):
         try:
             odi = int(st.get("output_device_index", -1))
             if odi >= 0:
-                self.engine.set_output_device_by_index(odi)
+                self.engine.configure(AudioConfig(device_id=odi, sample_rate=self.engine.sample_rate))
                 self._refresh_output_devices()
                 for i in range(self.output_combo.count()):
                     if self.output_combo.itemData(i) == int(odi):
@@ -949,10 +1339,8 @@ class MainWindow(QMainWindow):
             pass
 
         try:
-            if hasattr(self, "radial_smoothness_slider"):
-                self.radial_smoothness_slider.setValue(int(st.get("radial_waveform_smoothness", self.radial_smoothness_slider.value())))
-            if hasattr(self, "radial_temporal_slider"):
-                self.radial_temporal_slider.setValue(int(st.get("radial_temporal_smoothing", self.radial_temporal_slider.value())))
+            self.radial_smoothness_slider.setValue(int(st.get("radial_waveform_smoothness", self.radial_smoothness_slider.value())))
+            self.radial_temporal_slider.setValue(int(st.get("radial_temporal_smoothing", self.radial_temporal_slider.value())))
         except Exception:
             pass
 
@@ -964,7 +1352,6 @@ class MainWindow(QMainWindow):
                 offset_y=int(st.get("bg_offset_y", 0)),
                 dim_percent=int(st.get("bg_dim_percent", 0)),
             )
-            self.bg_panel.set_config(bg)
             self.view.set_background_config(bg)
         except Exception:
             pass
@@ -981,19 +1368,19 @@ class MainWindow(QMainWindow):
             pass
 
         try:
-            self.shadow_panel.chk.setChecked(bool(st.get("shadow_enabled", False)))
-            self.shadow_panel.opacity.setValue(int(st.get("shadow_opacity", 50)))
-            self.shadow_panel.blur.setValue(int(st.get("shadow_blur_radius", 16)))
-            self.shadow_panel.distance.setValue(int(st.get("shadow_distance", 8)))
-            self.shadow_panel.angle.setValue(int(st.get("shadow_angle_deg", 45)))
-            self.shadow_panel.spread.setValue(int(st.get("shadow_spread", 6)))
+            self.view.set_shadow_enabled(bool(st.get("shadow_enabled", False)))
+            self.view.set_shadow_opacity(int(st.get("shadow_opacity", 50)))
+            self.view.set_shadow_blur_radius(int(st.get("shadow_blur_radius", 16)))
+            self.view.set_shadow_distance(int(st.get("shadow_distance", 8)))
+            self.view.set_shadow_angle_deg(int(st.get("shadow_angle_deg", 45)))
+            self.view.set_shadow_spread(int(st.get("shadow_spread", 6)))
         except Exception:
             pass
 
         try:
-            self.glow_panel.chk.setChecked(bool(st.get("glow_enabled", False)))
-            self.glow_panel.radius.setValue(int(st.get("glow_radius", 22)))
-            self.glow_panel.strength.setValue(int(st.get("glow_strength", 80)))
+            self.view.set_glow_enabled(bool(st.get("glow_enabled", False)))
+            self.view.set_glow_radius(int(st.get("glow_radius", 22)))
+            self.view.set_glow_strength(int(st.get("glow_strength", 80)))
             gc = str(st.get("glow_color", "") or "")
             if gc:
                 self.view.set_glow_color(gc)
@@ -1001,9 +1388,9 @@ class MainWindow(QMainWindow):
             pass
 
         try:
-            self.radial_panel.chk.setChecked(bool(st.get("fill_enabled", False)))
-            self.radial_panel.thr.setValue(int(round(float(st.get("fill_threshold", 0.1)) * 100.0)))
-            self.radial_panel.blend.setCurrentText(str(st.get("fill_blend", "normal")))
+            self.view.set_radial_fill_enabled(bool(st.get("fill_enabled", False)))
+            self.view.set_radial_fill_threshold(float(st.get("fill_threshold", 0.1)))
+            self.view.set_radial_fill_blend(str(st.get("fill_blend", "normal")))
             fc = str(st.get("fill_color", "") or "")
             if fc:
                 self.view.set_radial_fill_color(fc)
@@ -1011,18 +1398,19 @@ class MainWindow(QMainWindow):
             pass
 
     def _on_export_progress(self, p):
+        p = int(p)
+        if p == self.export_progress.value() and self.export_progress.isVisible():
+            return
         try:
-            if hasattr(self, "export_progress"):
-                self.export_progress.setVisible(True)
-                self.export_progress.setValue(int(p))
-            self.statusBar().showMessage(f"Exporting... {int(p)}%")
+            self.export_progress.setVisible(True)
+            self.export_progress.setValue(p)
+            self.statusBar().showMessage(f"Exporting... {p}%")
         except Exception:
             pass
 
     def _on_export_done(self):
         try:
-            if hasattr(self, "export_progress"):
-                self.export_progress.setVisible(False)
+            self.export_progress.setVisible(False)
             self.statusBar().showMessage("Export complete")
         except Exception:
             pass
@@ -1030,42 +1418,19 @@ class MainWindow(QMainWindow):
 
     def _on_export_failed(self, msg):
         try:
-            if hasattr(self, "export_progress"):
-                self.export_progress.setVisible(False)
+            self.export_progress.setVisible(False)
             self.statusBar().showMessage(f"Export failed: {msg}")
         except Exception:
             pass
         self.export_btn.setEnabled(True)
 
-    def _export(self):
-        if not self.engine.current_audio_path:
-            return
-
-        if getattr(self, "_export_proc", None) is not None:
-            return
-
-        path, _ = QFileDialog.getSaveFileName(self, "Save video", "", "MP4 Video (*.mp4)")
-        if not path:
-            return
-        if not os.path.splitext(path)[1]:
-            path = path + ".mp4"
-
-        w = int(self.exp_w.value())
-        h = int(self.exp_h.value())
-        fps = int(self.exp_fps.value())
-        mode = str(self.mode_combo.currentText())
-        color = tuple(self.view.color)
-        sens = float(self.view.waveform_sensitivity)
-
-        gpu_device = ""
-        if bool(self.exp_gpu.isChecked()) and self.exp_gpu.isEnabled():
-            gpu_device = str(self.exp_gpu_device.currentData() or "auto")
-
-        view_state = {
+    def _build_view_state(self) -> dict:
+        bg_ox, bg_oy = self.view._bg_off
+        return {
             "background_path": self.view._bg_path,
             "background_scale_mode": self.view._bg_scale_mode,
-            "background_offset_x": self.view._bg_off[0],
-            "background_offset_y": self.view._bg_off[1],
+            "background_offset_x": bg_ox,
+            "background_offset_y": bg_oy,
             "background_dim_percent": self.view._bg_dim,
 
             "radial_rotation_deg": self.view.radial_rotation_deg,
@@ -1083,7 +1448,7 @@ class MainWindow(QMainWindow):
             "feather_audio_enabled": bool(self.view.feather_audio_enabled),
             "feather_audio_amount": int(self.view.feather_audio_amount),
 
-            "radial_smooth_amount": int(self.smooth_amt.value() if self.smooth_amt is not None else 50),
+            "radial_smooth_amount": int(self.view.radial_smooth_amount),
 
             "shadow_enabled": bool(self.view._shadow_enabled),
             "shadow_opacity": int(float(self.view._shadow_opacity) * 100),
@@ -1093,16 +1458,49 @@ class MainWindow(QMainWindow):
             "shadow_spread": int(self.view._shadow_spread),
 
             "glow_enabled": bool(self.view._glow_enabled),
-            "glow_color": self.view._glow_color.name(QColor.HexArgb),
+            "glow_color": self.view._glow_color_hex,
             "glow_radius": int(self.view._glow_radius),
             "glow_strength": int(float(self.view._glow_strength) * 100),
 
             "radial_fill_enabled": bool(self.view._fill_enabled),
-            "radial_fill_color": self.view._fill_color.name(QColor.HexArgb),
+            "radial_fill_color": self.view._fill_color_hex,
             "radial_fill_blend": str(self.view._fill_blend),
             "radial_fill_threshold": float(self.view._fill_threshold),
         }
 
+    @Slot()
+    def _export(self):
+        if not self.engine.current_audio_path:
+            return
+        self._flush_pending()
+
+        if getattr(self, "_export_proc", None) is not None:
+            return
+
+        path, _ = QFileDialog.getSaveFileName(self, "Save video", "", "MP4 Video (*.mp4)")
+        if not path:
+            return
+        if not os.path.splitext(path)[1]:
+            path = path + ".mp4"
+
+        w = int(self.exp_w.value())
+        h = int(self.exp_h.value())
+        fps = int(self.exp_fps.value())
+        mode = str(self.mode_combo.currentText())
+        color = tuple(self.view.color)
+        sens = float(self.view.waveform_sensitivity)
+
+        gpu_device = ""
+        if bool(self.exp_gpu.isChecked()) and self.exp_gpu.isEnabled():
+            gpu_device = str(self.exp_gpu_device.currentData() or "auto")
+
+        # Rebuilt only when a view setter has run since the last export
+        rev = self.view._state_rev
+        if self._view_state_cache is None or self._view_state_rev != rev:
+            self._view_state_cache = self._build_view_state()
+            self._view_state_rev = rev
+        view_state = self._view_state_cache
+
         project_root = str(Path(__file__).resolve().parents[1])
         cfg = {
             "project_root": project_root,
@@ -1150,6 +1548,7 @@ class MainWindow(QMainWindow):
         proc.finished.connect(self._on_export_proc_finished)
         proc.start()
 
+    @Slot()
     def _on_export_proc_stdout(self) -> None:
         proc = getattr(self, "_export_proc", None)
         if proc is None:
@@ -1182,6 +1581,7 @@ class MainWindow(QMainWindow):
             elif t == "error":
                 self._export_worker_error = str(msg.get("message", "Export failed"))
 
+    @Slot()
     def _on_export_proc_stderr(self) -> None:
         proc = getattr(self, "_export_proc", None)
         if proc is None:
@@ -1193,6 +1593,7 @@ class MainWindow(QMainWindow):
         prev = str(getattr(self, "_export_stderr", ""))
         self._export_stderr = (prev + chunk)[-20000:]
 
+    @Slot(int, QProcess.ExitStatus)
     def _on_export_proc_finished(self, exit_code: int, exit_status) -> None:
         err = str(getattr(self, "_export_worker_error", "") or "")
         done = bool(getattr(self, "_export_worker_done", False))
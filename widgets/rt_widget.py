@@ -1,10 +1,11 @@
+import functools
 import logging
 import math
 import os
 import time
 
 import numpy as np
-from PySide6.QtCore import Qt, QTimer, QSize, QRect
+from PySide6.QtCore import Qt, QTimer, QSize, QRect, QThread, QCoreApplication
 from PySide6.QtGui import (
     QPainter, QColor, QPen, QImage, QPainterPath, QPixmap,
     QTransform, QSurfaceFormat,
@@ -21,6 +22,40 @@ logger = logging.getLogger(__name__)
 _WidgetBase = QOpenGLWidget if _HAS_GL_WIDGET else QWidget
 
 
+def _to_qcolor(value):
+    # QColor and int tuples skip the string parser; strings go through it
+    if isinstance(value, QColor):
+        c = QColor(value)
+    elif isinstance(value, tuple):
+        c = QColor(*value) if value else QColor()
+    elif value:
+        c = QColor(value)
+    else:
+        return None
+    return c if c.isValid() else None
+
+
+@functools.lru_cache(maxsize=32)
+def _smooth_plan(L, amount):
+    # Interp grids and box kernel depend only on (length, amount), which
+    # change on slider moves, not per frame
+    up = int(1 + (amount // 25))
+    grid = None
+    if up > 1:
+        grid = (np.arange(L, dtype=float), np.linspace(0.0, L - 1, L * up))
+    half = int(amount * 0.06)
+    win = 2 * half + 1
+    ker = np.full(win, 1.0 / win) if win > 1 else None
+    return grid, half, ker
+
+
+def _ema_inplace(state, x, alpha):
+    # state = alpha * state + (1 - alpha) * x, without rebinding state
+    state *= alpha
+    state += (1.0 - alpha) * x
+    return state
+
+
 class RTVisualizerWidget(_WidgetBase):
 
     # -- Init --
@@ -32,12 +67,16 @@ class RTVisualizerWidget(_WidgetBase):
             fmt = QSurfaceFormat()
             fmt.setStencilBufferSize(8)
             fmt.setSwapBehavior(QSurfaceFormat.DoubleBuffer)
+            fmt.setSwapInterval(0)
+            fmt.setSamples(0)
             self.setFormat(fmt)
             logger.info("RTVisualizerWidget: QOpenGLWidget (GPU-backed QPainter)")
         else:
             logger.info("RTVisualizerWidget: QWidget (software raster)")
 
         self.audio = audio_engine
+        # Bumped by every setter; lets callers cache derived snapshots
+        self._state_rev = 0
         self._mode = "Waveform - Linear"
         self._offscreen_paint = False
         self._offscreen_size = None
@@ -86,6 +125,7 @@ class RTVisualizerWidget(_WidgetBase):
 
         self._glow_enabled = False
         self._glow_color = QColor(80, 220, 255, 255)
+        self._glow_color_hex = self._glow_color.name(QColor.HexArgb)
         self._glow_radius = 22
         self._glow_strength = 0.8
         self._glow_layers = 8
@@ -100,6 +140,7 @@ class RTVisualizerWidget(_WidgetBase):
 
         self._fill_enabled = False
         self._fill_color = QColor(255, 255, 255, 48)
+        self._fill_color_hex = self._fill_color.name(QColor.HexArgb)
         self._fill_blend = "normal"
         self._fill_threshold = 0.1
 
@@ -114,6 +155,8 @@ class RTVisualizerWidget(_WidgetBase):
         self.feather_audio_amount = 40
 
         self._hud = True
+        self.safe_mode = False
+        self._pre_safe_blur = None
         self._fps_cap = 60
         self._last_paint_t = None
         self._fps_smoothed = 0.0
@@ -127,58 +170,65 @@ class RTVisualizerWidget(_WidgetBase):
             self._update_timer()
         self.setMinimumSize(400, 300)
 
+    def _state_changed(self):
+        self._state_rev += 1
+        self.update()
+
     # -- Public setters: mode, color, sensitivity --
 
     def set_mode(self, mode):
         self._mode = str(mode)
-        self.update()
+        self._state_changed()
 
     def set_color(self, rgb):
         self.color = tuple(float(x) for x in rgb)
-        self.update()
+        self._state_changed()
 
     def set_waveform_sensitivity(self, s):
         try:
             self.waveform_sensitivity = max(0.05, float(s))
         except Exception:
             self.waveform_sensitivity = 1.0
-        self.update()
+        self._state_changed()
+
+    def set_waveform_sensitivity_pct(self, pct):
+        """Slider-facing variant: integer percent, 100 == 1.0."""
+        self.set_waveform_sensitivity(pct * 0.01)
 
     def set_feather_sensitivity(self, s):
         try:
             self.feather_sensitivity = max(0.05, float(s))
         except Exception:
             self.feather_sensitivity = 2.0
-        self.update()
+        self._state_changed()
 
     def set_sensitivity(self, s):
         self.set_waveform_sensitivity(s)
 
     # -- Setters: gradient --
 
-    def set_gradient_colors(self, a_hex, b_hex):
-        if a_hex:
-            ca = QColor(a_hex)
-            if ca.isValid():
-                self._grad_a = ca
-        if b_hex:
-            cb = QColor(b_hex)
-            if cb.isValid():
-                self._grad_b = cb
-        self.update()
+    def set_gradient_colors(self, a, b):
+        """Accepts QColor, (r, g, b[, a]) int tuples, or colour strings."""
+        ca = _to_qcolor(a)
+        if ca is not None:
+            self._grad_a = ca
+        cb = _to_qcolor(b)
+        if cb is not None:
+            self._grad_b = cb
+        self._state_changed()
 
     def set_gradient_curve(self, name):
         self._grad_curve = (name or "linear").lower()
-        self.update()
+        self._state_changed()
 
     def set_gradient_clamp(self, amin, amax):
         self._grad_min = float(min(amin, amax))
         self._grad_max = float(max(amin, amax))
-        self.update()
+        self._state_changed()
 
     def set_gradient_smoothing(self, alpha):
         self._amp_alpha = float(max(0.0, min(1.0, alpha)))
-        self.update()
+        self._state_changed()
 
     # -- Setters: radial --
 
@@ -187,15 +237,15 @@ class RTVisualizerWidget(_WidgetBase):
             self.radial_rotation_deg = float(deg)
         except Exception:
             self.radial_rotation_deg = 0.0
-        self.update()
+        self._state_changed()
 
     def set_radial_mirror(self, on):
         self.radial_mirror = bool(on)
-        self.update()
+        self._state_changed()
 
     def set_radial_smooth(self, on):
         self.radial_smooth = True
-        self.update()
+        self._state_changed()
 
     def set_radial_smooth_amount(self, v):
         try:
@@ -203,7 +253,7 @@ class RTVisualizerWidget(_WidgetBase):
         except Exception:
             v = 0
         self.radial_smooth_amount = max(0, min(100, v))
-        self.update()
+        self._state_changed()
 
     def set_radial_waveform_smoothness(self, v):
         try:
@@ -211,7 +261,7 @@ class RTVisualizerWidget(_WidgetBase):
         except Exception:
             v = 0
         self.radial_wave_smoothness = max(0, min(100, v))
-        self.update()
+        self._state_changed()
 
     def set_radial_temporal_smoothing(self, v):
         try:
@@ -219,7 +269,7 @@ class RTVisualizerWidget(_WidgetBase):
         except Exception:
             v = 0
         self.radial_temporal_alpha = max(0.0, min(0.95, v / 100.0))
-        self.update()
+        self._state_changed()
 
     # -- Setters: center image / feather --
 
@@ -236,14 +286,14 @@ class RTVisualizerWidget(_WidgetBase):
                 norm = str(image_path)
             self.center_image = img
             self.center_image_path = norm
-            self.update()
+            self._state_changed()
             return True
         except Exception:
             return False
 
     def clear_center_image(self):
         self.center_image = None
-        self.update()
+        self._state_changed()
 
     def set_center_image_zoom(self, value):
         try:
@@ -251,7 +301,7 @@ class RTVisualizerWidget(_WidgetBase):
         except Exception:
             v = 100
         self.center_image_zoom = max(50, min(250, v))
-        self.update()
+        self._state_changed()
 
     def set_center_motion(self, value):
         try:
@@ -259,11 +309,11 @@ class RTVisualizerWidget(_WidgetBase):
         except Exception:
             v = 0
         self.center_motion = max(0, min(100, v))
-        self.update()
+        self._state_changed()
 
     def set_feather_enabled(self, enabled):
         self.feather_enabled = bool(enabled)
-        self.update()
+        self._state_changed()
 
     def set_waviness(self, value):
         try:
@@ -273,7 +323,7 @@ class RTVisualizerWidget(_WidgetBase):
         v = max(0, min(100, v))
         self.edge_waviness = v
         self.feather_noise = v
-        self.update()
+        self._state_changed()
 
     def set_feather_noise(self, value):
         self.set_waviness(value)
@@ -283,7 +333,7 @@ class RTVisualizerWidget(_WidgetBase):
 
     def set_feather_audio_enabled(self, enabled):
         self.feather_audio_enabled = bool(enabled)
-        self.update()
+        self._state_changed()
 
     def set_feather_audio_amount(self, value):
         try:
@@ -291,97 +341,106 @@ class RTVisualizerWidget(_WidgetBase):
         except Exception:
             v = 0
         self.feather_audio_amount = max(0, min(100, v))
-        self.update()
+        self._state_changed()
 
     # -- Setters: shadow --
 
+    def _set_shadow_field(self, attr, value):
+        # Redundant sets (preset reloads, repeated slider values) skip the repaint
+        if getattr(self, attr) != value:
+            setattr(self, attr, value)
+            self._state_changed()
+
     def set_shadow_enabled(self, enabled):
-        self._shadow_enabled = bool(enabled)
-        self.update()
+        self._set_shadow_field("_shadow_enabled", bool(enabled))
 
     def set_shadow_opacity(self, pct):
         try:
-            self._shadow_opacity = max(0.0, min(1.0, pct / 100.0))
+            v = max(0.0, min(1.0, pct / 100.0))
         except Exception:
-            self._shadow_opacity = 0.6
-        self.update()
+            v = 0.6
+        self._set_shadow_field("_shadow_opacity", v)
 
     def set_shadow_blur_radius(self, r):
         try:
-            self._shadow_blur = int(max(0, r))
+            v = int(max(0, r))
         except Exception:
-            self._shadow_blur = 16
-        self.update()
+            v = 16
+        # An explicit blur while in safe mode is kept when safe mode ends
+        self._pre_safe_blur = None
+        self._set_shadow_field("_shadow_blur", v)
 
     def set_shadow_distance(self, dist):
         try:
-            self._shadow_distance = int(max(0, dist))
+            v = int(max(0, dist))
         except Exception:
-            self._shadow_distance = 8
-        self.update()
+            v = 8
+        self._set_shadow_field("_shadow_distance", v)
 
     def set_shadow_angle_deg(self, deg):
         try:
-            self._shadow_angle_deg = int(deg)
+            v = int(deg)
         except Exception:
-            self._shadow_angle_deg = 45
-        self.update()
+            v = 45
+        self._set_shadow_field("_shadow_angle_deg", v)
 
     def set_shadow_spread(self, n):
         try:
-            self._shadow_spread = int(max(1, n))
+            v = int(max(1, n))
         except Exception:
-            self._shadow_spread = 6
-        self.update()
+            v = 6
+        self._set_shadow_field("_shadow_spread", v)
 
     # -- Setters: glow --
 
     def set_glow_enabled(self, enabled):
         self._glow_enabled = bool(enabled)
-        self.update()
+        self._state_changed()
 
     def set_glow_color(self, rgba_hex):
         c = QColor(rgba_hex)
         if c.isValid():
             self._glow_color = c
-        self.update()
+            self._glow_color_hex = c.name(QColor.HexArgb)
+        self._state_changed()
 
     def set_glow_radius(self, px):
         try:
             self._glow_radius = int(max(0, px))
         except Exception:
             self._glow_radius = 26
-        self.update()
+        self._state_changed()
 
     def set_glow_strength(self, pct):
         try:
             self._glow_strength = max(0.0, min(1.0, float(pct) / 100.0))
         except Exception:
             self._glow_strength = 0.9
-        self.update()
+        self._state_changed()
 
     # -- Setters: radial fill --
 
     def set_radial_fill_enabled(self, on):
         self._fill_enabled = bool(on)
-        self.update()
+        self._state_changed()
 
     def set_radial_fill_color(self, rgba_hex):
         c = QColor(rgba_hex)
         if c.isValid():
             self._fill_color = c
-        self.update()
+            self._fill_color_hex = c.name(QColor.HexArgb)
+        self._state_changed()
 
     def set_radial_fill_blend(self, mode):
         self._fill_blend = mode or "normal"
-        self.update()
+        self._state_changed()
 
     def set_radial_fill_threshold(self, t):
         try:
             self._fill_threshold = float(max(0.0, min(1.0, t)))
         except Exception:
             self._fill_threshold = 0.1
-        self.update()
+        self._state_changed()
 
     # -- Setters: background --
 
@@ -408,7 +467,6 @@ class RTVisualizerWidget(_WidgetBase):
             self._bg_pix_cache_key = None
 
             # QPixmap is only safe in the GUI thread
-            from PySide6.QtCore import QThread, QCoreApplication
             try:
                 app = QCoreApplication.instance()
                 in_gui = bool(app and app.thread() == QThread.currentThread())
@@ -424,7 +482,7 @@ class RTVisualizerWidget(_WidgetBase):
                 self._bg_pix = None
         except Exception:
             pass
-        self.update()
+        self._state_changed()
 
     # -- Setters: misc --
 
@@ -435,37 +493,43 @@ class RTVisualizerWidget(_WidgetBase):
             fps = 60
         self._fps_cap = max(1, fps)
         self._update_timer()
-        self.update()
+        self._state_changed()
 
     def set_hud_enabled(self, on):
         self._hud = bool(on)
-        self.update()
+        self._state_changed()
 
     def set_safe_mode(self, on):
-        if on:
+        on = bool(on)
+        if on and not self.safe_mode:
+            self._pre_safe_blur = self._shadow_blur
             self._shadow_blur = min(self._shadow_blur, 6)
-        self.update()
+        elif not on and self.safe_mode and self._pre_safe_blur is not None:
+            self._shadow_blur = self._pre_safe_blur
+            self._pre_safe_blur = None
+        self.safe_mode = on
+        self._state_changed()
 
     def set_particle_density(self, v):
         try:
             self.particle_density = int(max(10, min(2000, v)))
         except Exception:
             self.particle_density = 200
-        self.update()
+        self._state_changed()
 
     def set_particle_speed(self, v):
         try:
             self.particle_speed = float(max(0.1, min(5.0, v / 50.0)))
         except Exception:
             self.particle_speed = 1.0
-        self.update()
+        self._state_changed()
 
     def set_particle_glow(self, v):
         try:
             self.particle_glow = float(max(0.0, min(2.0, v / 50.0)))
         except Exception:
             self.particle_glow = 0.6
-        self.update()
+        self._state_changed()
 
     def reset_time(self):
         self._phase = 0.0
@@ -518,20 +582,19 @@ class RTVisualizerWidget(_WidgetBase):
 
     def _draw_bg_image(self, p, source, w, h, draw_image):
         mode = (self._bg_scale_mode or "fill").lower()
+        ox, oy = self._bg_off
         if mode == 'tile':
             sw, sh = source.width(), source.height()
+            draw = p.drawImage if draw_image else p.drawPixmap
             for ty in range(0, h, sh):
                 for tx in range(0, w, sw):
-                    if draw_image:
-                        p.drawImage(tx + self._bg_off[0], ty + self._bg_off[1], source)
-                    else:
-                        p.drawPixmap(tx + self._bg_off[0], ty + self._bg_off[1], source)
+                    draw(tx + ox, ty + oy, source)
         else:
             scaled = self._scaled_bg_for(source, w, h, mode, draw_image)
             if scaled is None:
                 return
-            x = (w - scaled.width()) // 2 + self._bg_off[0]
-            y = (h - scaled.height()) // 2 + self._bg_off[1]
+            x = (w - scaled.width()) // 2 + ox
+            y = (h - scaled.height()) // 2 + oy
             if draw_image:
                 p.drawImage(x, y, scaled)
             else:
@@ -952,9 +1015,9 @@ class RTVisualizerWidget(_WidgetBase):
 
             if self.radial_temporal_alpha > 0.0:
                 if self._radial_prev is None or len(self._radial_prev) != L:
-                    self._radial_prev = spec_draw.copy()
+                    self._radial_prev = np.array(spec_draw, dtype=float)
                 else:
-                    self._radial_prev = self.radial_temporal_alpha * self._radial_prev + (1.0 - self.radial_temporal_alpha) * spec_draw
+                    _ema_inplace(self._radial_prev, spec_draw, self.radial_temporal_alpha)
                 spec_draw = self._radial_prev
 
             if self.radial_smooth and L > 3:
@@ -1121,17 +1184,11 @@ class RTVisualizerWidget(_WidgetBase):
     def _smooth_closed(self, arr, amount):
         if arr is None or len(arr) == 0 or amount <= 0:
             return arr
-        L = len(arr)
-        up = int(1 + (amount // 25))
+        grid, half, ker = _smooth_plan(len(arr), int(amount))
         a = np.asarray(arr, dtype=float)
-        if up > 1:
-            x = np.arange(L, dtype=float)
-            xi = np.linspace(0.0, L - 1, L * up)
-            a = np.interp(xi, x, a)
-        half = int(amount * 0.06)
-        win = 2 * half + 1
-        if win > 1:
+        if grid is not None:
+            a = np.interp(grid[1], grid[0], a)
+        if ker is not None:
             pad = np.pad(a, (half, half), mode='wrap')
-            ker = np.ones(win, dtype=float) / float(win)
             a = np.convolve(pad, ker, mode='valid')
         return a